@@ -44,8 +44,9 @@ class AudioSyncTool(FFmpegToolApp):
         row1.pack(fill="x", pady=5)
         
         ttk.Label(row1, text="Delay (seconds):").pack(side="left")
-        self.delay_spin = ttk.Spinbox(row1, from_=-60, to=60, increment=0.1, width=10)
-        self.delay_spin.set(0.0)
+        self.delay_var = tk.DoubleVar(value=0.0)
+        self.delay_spin = ttk.Spinbox(row1, textvariable=self.delay_var, from_=-60, to=60,
+                                      increment=0.1, width=10)
         self.delay_spin.pack(side="left", padx=5)
         
         ttk.Label(row1, text="(+ = audio later, - = audio earlier)").pack(side="left", padx=5)
@@ -95,8 +96,7 @@ class AudioSyncTool(FFmpegToolApp):
         self.create_bottom_section(self.root)
     
     def _adjust_delay(self, delta):
-        current = float(self.delay_spin.get())
-        self.delay_spin.set(round(current + delta, 2))
+        self.delay_var.set(round(self.delay_var.get() + delta, 2))
     
     def run_sync(self):
         input_file = self.input_entry.get()
@@ -111,7 +111,7 @@ class AudioSyncTool(FFmpegToolApp):
             self.out_entry.delete(0, tk.END)
             self.out_entry.insert(0, output_file)
         
-        delay = float(self.delay_spin.get())
+        delay = self.delay_var.get()
         mode = self.mode_var.get()
         
         cmd = [get_binary("ffmpeg"), "-y", "-i", input_file]
@@ -122,8 +122,9 @@ class AudioSyncTool(FFmpegToolApp):
         elif mode == "delay":
             # Delay audio (positive = audio comes later)
             if delay > 0:
-                cmd.extend(["-itsoffset", str(delay), "-i", input_file])
-                cmd.extend(["-map", "0:v", "-map", "1:a"])
+                # Shift audio timestamps in a single input instead of demuxing the file twice
+                cmd.extend(["-filter_complex", f"[0:a]asetpts=PTS+{delay}/TB[a]"])
+                cmd.extend(["-map", "0:v", "-map", "[a]"])
             else:
                 # Trim beginning of audio
                 cmd.extend(["-af", f"adelay={int(abs(delay)*1000)}|{int(abs(delay)*1000)}"])
@@ -7,6 +7,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog
 import subprocess
 import threading
+import shutil
 import os
 import sys
 from pathlib import Path
@@ -170,6 +171,17 @@ class BatchTool(FFmpegToolApp):
         
         ensure_dir(Path(output_folder))
         
+        # Conservative disk-space precheck so a full disk fails before any encode starts
+        total_in = sum(os.path.getsize(f) for f in self.input_files if os.path.isfile(f))
+        free = shutil.disk_usage(output_folder).free
+        if total_in * 1.5 > free:
+            if not tk.messagebox.askyesno(
+                "Low Disk Space",
+                f"Output folder has {free / (1024**3):.2f} GB free, but this batch may need "
+                f"up to {total_in * 1.5 / (1024**3):.2f} GB.\n\nContinue anyway?"
+            ):
+                return
+        
         self.processing = True
         self.run_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
@@ -201,7 +213,9 @@ class BatchTool(FFmpegToolApp):
             
             try:
                 creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-                result = subprocess.run(cmd, capture_output=True, text=True, creationflags=creationflags)
+                # Only stderr is reported; discard stdout rather than buffering it
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                        text=True, bufsize=1 << 20, creationflags=creationflags)
                 if result.returncode != 0:
                     self._on_log(f"Error: {result.stderr[-500:]}\n")
                 else:
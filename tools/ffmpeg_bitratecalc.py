@@ -47,8 +47,8 @@ class BitrateCalcTool(FFmpegToolApp):
         row1.pack(fill="x", pady=5)
         
         ttk.Label(row1, text="Duration (seconds):").pack(side="left")
-        self.duration_spin = ttk.Spinbox(row1, from_=1, to=99999, width=10)
-        self.duration_spin.set(60)
+        self.duration_var = tk.DoubleVar(value=60)
+        self.duration_spin = ttk.Spinbox(row1, textvariable=self.duration_var, from_=1, to=99999, width=10)
         self.duration_spin.pack(side="left", padx=5)
         
         # Target file size
@@ -56,8 +56,8 @@ class BitrateCalcTool(FFmpegToolApp):
         row2.pack(fill="x", pady=5)
         
         ttk.Label(row2, text="Target File Size:").pack(side="left")
-        self.size_spin = ttk.Spinbox(row2, from_=1, to=99999, width=10)
-        self.size_spin.set(100)
+        self.size_var = tk.DoubleVar(value=100)
+        self.size_spin = ttk.Spinbox(row2, textvariable=self.size_var, from_=1, to=99999, width=10)
         self.size_spin.pack(side="left", padx=5)
         
         self.size_unit_var = tk.StringVar(value="MB")
@@ -69,8 +69,8 @@ class BitrateCalcTool(FFmpegToolApp):
         row3.pack(fill="x", pady=5)
         
         ttk.Label(row3, text="Audio Bitrate (kbps):").pack(side="left")
-        self.audio_spin = ttk.Spinbox(row3, from_=0, to=512, width=8)
-        self.audio_spin.set(128)
+        self.audio_var = tk.IntVar(value=128)
+        self.audio_spin = ttk.Spinbox(row3, textvariable=self.audio_var, from_=0, to=512, width=8)
         self.audio_spin.pack(side="left", padx=5)
         
         # Calculate button
@@ -111,8 +111,7 @@ class BitrateCalcTool(FFmpegToolApp):
             # Get duration
             duration = get_media_duration(filepath)
             if duration:
-                self.duration_spin.delete(0, tk.END)
-                self.duration_spin.insert(0, int(duration))
+                self.duration_var.set(int(duration))
                 
                 # Get current bitrate
                 info = get_media_info(filepath)
@@ -122,10 +121,10 @@ class BitrateCalcTool(FFmpegToolApp):
                     self.info_label.config(text=f"Current: {bitrate} kbps, {size_mb:.1f} MB, {duration:.1f}s")
     
     def calculate(self):
-        duration = float(self.duration_spin.get())
-        target_size = float(self.size_spin.get())
+        duration = self.duration_var.get()
+        target_size = self.size_var.get()
         size_unit = self.size_unit_var.get()
-        audio_bitrate = float(self.audio_spin.get())
+        audio_bitrate = self.audio_var.get()
         
         # Convert to bits
         if size_unit == "KB":
@@ -185,7 +184,7 @@ Two-pass encoding recommended for accuracy.
             self.out_entry.delete(0, tk.END)
             self.out_entry.insert(0, output_file)
         
-        audio_bitrate = int(self.audio_spin.get())
+        audio_bitrate = self.audio_var.get()
         
         cmd = [
             get_binary("ffmpeg"), "-y", "-i", input_file,
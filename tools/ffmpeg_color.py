@@ -3,22 +3,107 @@ FFmpeg Color Tool
 Adjust video color (brightness, contrast, saturation, etc.)
 """
 
+import hashlib
+import io
+import os
+import subprocess
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, messagebox
 from pathlib import Path
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
-    generate_output_path, browse_file, browse_save_file, create_card, get_theme
+    FFmpegToolApp, get_binary, get_media_duration, get_media_info, format_duration, probe_async, nvenc_quality_args,
+    generate_output_path, browse_file, browse_save_file, create_card, get_theme, load_config,
+    TEMP_DIR, SPAWN_KWARGS
 )
 
+try:
+    from PIL import Image, ImageEnhance, ImageTk
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+def color_lut_values(brightness: float, contrast: float, gamma: float) -> list:
+    """Return the 256-entry brightness/contrast/gamma transfer curve as floats in [0, 1]."""
+    values = []
+    for i in range(256):
+        v = (i / 255.0 - 0.5) * contrast + 0.5 + brightness
+        values.append(min(max(v, 0.0), 1.0) ** (1.0 / gamma))
+    return values
+
+def build_color_lut(brightness: float, contrast: float, gamma: float) -> Path:
+    """Write a 256-entry 1D .cube LUT for brightness/contrast/gamma and return its path.
+    
+    The file name is derived from the parameters, so repeated presets reuse the same LUT.
+    """
+    key = f"{brightness:.4f}:{contrast:.4f}:{gamma:.4f}"
+    lut_path = TEMP_DIR / f"color_{hashlib.sha1(key.encode()).hexdigest()[:12]}.cube"
+    if lut_path.exists():
+        return lut_path
+    
+    lines = ["LUT_1D_SIZE 256\n"]
+    for v in color_lut_values(brightness, contrast, gamma):
+        lines.append(f"{v:.6f} {v:.6f} {v:.6f}\n")
+    lut_path.write_text("".join(lines), encoding="utf-8")
+    return lut_path
+
 class ColorApp(FFmpegToolApp):
     """Video color adjustment tool."""
     
+    # (key, label, min, max, default) in the order build_command and presets expect
+    SLIDERS = (
+        ("brightness", "Brightness:", -1, 1, 0),
+        ("contrast", "Contrast:", 0, 2, 1),
+        ("saturation", "Saturation:", 0, 3, 1),
+        ("gamma", "Gamma:", 0.1, 3, 1),
+    )
+    
     def __init__(self):
         super().__init__("FFmpeg Color Adjust", width=600, height=600)
+        self._label_jobs = {}
+        self._preview_source = None  # (input path, small RGB frame) sampled for the preview
+        self._preview_photo = None
+        self._color_props = (None, {})  # (input path, source color tags), filled in by the browse probe
         self.build_ui()
     
+    def _slider_row(self, parent, text, lo, hi, default, fmt="{:.2f}"):
+        """Build a labelled slider row; returns (variable, value label)."""
+        row = ttk.Frame(parent)
+        row.pack(fill="x", pady=3)
+        ttk.Label(row, text=text, width=12).pack(side="left")
+        var = tk.DoubleVar(value=default)
+        value_label = ttk.Label(row, text=fmt.format(default))
+        ttk.Scale(row, from_=lo, to=hi, variable=var, orient="horizontal", length=200,
+                  command=self._debounced_label(value_label, var, fmt)).pack(side="left", padx=5)
+        value_label.pack(side="left")
+        return var, value_label
+    
+    def _values(self):
+        """Current (brightness, contrast, saturation, gamma)."""
+        return tuple(var.get() for var, _ in self.controls.values())
+    
+    def _set_values(self, values):
+        for (var, label), value in zip(self.controls.values(), values):
+            var.set(value)
+            label.configure(text=f"{value:.2f}")
+        self._render_preview()
+    
+    def _debounced_label(self, label, var, fmt="{:.2f}"):
+        """Return a Scale command that refreshes label at most once per ~16 ms."""
+        key = str(label)
+        
+        def update():
+            del self._label_jobs[key]
+            label.configure(text=fmt.format(var.get()))
+            self._render_preview()
+        
+        def schedule(_value):
+            if key not in self._label_jobs:
+                self._label_jobs[key] = self.root.after(16, update)
+        
+        return schedule
+    
     def build_ui(self):
         theme = get_theme()
         
@@ -41,57 +126,17 @@ class ColorApp(FFmpegToolApp):
         color_card = create_card(main_frame, "🎨 Color Adjustments")
         color_card.pack(fill="x", pady=(0, 10))
         
-        # Brightness
-        bright_row = ttk.Frame(color_card)
-        bright_row.pack(fill="x", pady=3)
-        ttk.Label(bright_row, text="Brightness:", width=12).pack(side="left")
-        self.brightness_var = tk.DoubleVar(value=0)
-        bright_scale = ttk.Scale(bright_row, from_=-1, to=1, variable=self.brightness_var,
-                                 orient="horizontal", length=200)
-        bright_scale.pack(side="left", padx=5)
-        self.bright_label = ttk.Label(bright_row, text="0.00")
-        self.bright_label.pack(side="left")
-        bright_scale.configure(command=lambda v: self.bright_label.configure(text=f"{float(v):.2f}"))
-        
-        # Contrast
-        contrast_row = ttk.Frame(color_card)
-        contrast_row.pack(fill="x", pady=3)
-        ttk.Label(contrast_row, text="Contrast:", width=12).pack(side="left")
-        self.contrast_var = tk.DoubleVar(value=1)
-        contrast_scale = ttk.Scale(contrast_row, from_=0, to=2, variable=self.contrast_var,
-                                   orient="horizontal", length=200)
-        contrast_scale.pack(side="left", padx=5)
-        self.contrast_label = ttk.Label(contrast_row, text="1.00")
-        self.contrast_label.pack(side="left")
-        contrast_scale.configure(command=lambda v: self.contrast_label.configure(text=f"{float(v):.2f}"))
-        
-        # Saturation
-        sat_row = ttk.Frame(color_card)
-        sat_row.pack(fill="x", pady=3)
-        ttk.Label(sat_row, text="Saturation:", width=12).pack(side="left")
-        self.saturation_var = tk.DoubleVar(value=1)
-        sat_scale = ttk.Scale(sat_row, from_=0, to=3, variable=self.saturation_var,
-                              orient="horizontal", length=200)
-        sat_scale.pack(side="left", padx=5)
-        self.sat_label = ttk.Label(sat_row, text="1.00")
-        self.sat_label.pack(side="left")
-        sat_scale.configure(command=lambda v: self.sat_label.configure(text=f"{float(v):.2f}"))
-        
-        # Gamma
-        gamma_row = ttk.Frame(color_card)
-        gamma_row.pack(fill="x", pady=3)
-        ttk.Label(gamma_row, text="Gamma:", width=12).pack(side="left")
-        self.gamma_var = tk.DoubleVar(value=1)
-        gamma_scale = ttk.Scale(gamma_row, from_=0.1, to=3, variable=self.gamma_var,
-                                orient="horizontal", length=200)
-        gamma_scale.pack(side="left", padx=5)
-        self.gamma_label = ttk.Label(gamma_row, text="1.00")
-        self.gamma_label.pack(side="left")
-        gamma_scale.configure(command=lambda v: self.gamma_label.configure(text=f"{float(v):.2f}"))
+        self.controls = {}
+        for key, text, lo, hi, default in self.SLIDERS:
+            self.controls[key] = self._slider_row(color_card, text, lo, hi, default)
         
         # Reset button
         ttk.Button(color_card, text="Reset All", command=self._reset_values).pack(anchor="w", pady=5)
         
+        # Frame preview (filled in by the Preview button when Pillow is available)
+        self.frame_preview = ttk.Label(color_card)
+        self.frame_preview.pack(anchor="w")
+        
         # === Presets ===
         preset_card = create_card(main_frame, "📋 Presets")
         preset_card.pack(fill="x", pady=(0, 10))
@@ -108,7 +153,7 @@ class ColorApp(FFmpegToolApp):
         ]
         for name, b, c, s, g in presets:
             btn = ttk.Button(preset_row, text=name, width=10,
-                           command=lambda b=b, c=c, s=s, g=g: self._apply_preset(b, c, s, g))
+                           command=partial(self._apply_preset, b, c, s, g))
             btn.pack(side="left", padx=2)
         
         # === Output Section ===
@@ -123,6 +168,24 @@ class ColorApp(FFmpegToolApp):
         self.output_entry.pack(side="left", padx=5, fill="x", expand=True)
         ttk.Button(output_row, text="Browse", command=self._browse_output).pack(side="left")
         
+        accel_row = ttk.Frame(output_card)
+        accel_row.pack(fill="x", pady=(5, 0))
+        
+        ttk.Label(accel_row, text="Encoder:").pack(side="left")
+        default_accel = "gpu" if load_config().get("hw_accel_method") == "cuda" else "cpu"
+        self.accel_var = tk.StringVar(value=default_accel)
+        ttk.Radiobutton(accel_row, text="CPU (libx264)", variable=self.accel_var,
+                        value="cpu").pack(side="left", padx=5)
+        ttk.Radiobutton(accel_row, text="GPU (CUDA + NVENC)", variable=self.accel_var,
+                        value="gpu").pack(side="left", padx=5)
+        
+        # Advanced: cap filter threads (e.g. when slow storage is the bottleneck)
+        cpu_count = os.cpu_count() or 1
+        ttk.Label(accel_row, text="Filter threads:").pack(side="left", padx=(15, 0))
+        self.threads_var = tk.IntVar(value=max(1, cpu_count - 1))
+        ttk.Spinbox(accel_row, from_=1, to=cpu_count, textvariable=self.threads_var,
+                    width=4).pack(side="left", padx=5)
+        
         # === Action Buttons ===
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill="x", pady=10)
@@ -142,6 +205,10 @@ class ColorApp(FFmpegToolApp):
         
         input_path = self.input_entry.get()
         if input_path:
+            # Probe the color tags off the Tk thread; build_command only reads the result
+            future = probe_async(input_path, self._probe_color_props)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._apply_color_props, input_path, f.result()))
             output_path = generate_output_path(input_path, "_color")
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, output_path)
@@ -151,24 +218,60 @@ class ColorApp(FFmpegToolApp):
         browse_save_file(self.output_entry, filetypes, ".mp4")
     
     def _reset_values(self):
-        self.brightness_var.set(0)
-        self.contrast_var.set(1)
-        self.saturation_var.set(1)
-        self.gamma_var.set(1)
-        self.bright_label.configure(text="0.00")
-        self.contrast_label.configure(text="1.00")
-        self.sat_label.configure(text="1.00")
-        self.gamma_label.configure(text="1.00")
+        self._set_values([default for *_, default in self.SLIDERS])
     
     def _apply_preset(self, b, c, s, g):
-        self.brightness_var.set(b)
-        self.contrast_var.set(c)
-        self.saturation_var.set(s)
-        self.gamma_var.set(g)
-        self.bright_label.configure(text=f"{b:.2f}")
-        self.contrast_label.configure(text=f"{c:.2f}")
-        self.sat_label.configure(text=f"{s:.2f}")
-        self.gamma_label.configure(text=f"{g:.2f}")
+        self._set_values((b, c, s, g))
+    
+    @staticmethod
+    def _grab_preview_frame(input_path):
+        """One small RGB frame from the middle of the input, or None (runs on the probe pool)."""
+        duration = get_media_duration(input_path) or 0
+        cmd = [get_binary("ffmpeg"), "-v", "error", "-ss", str(duration / 2), "-i", input_path,
+               "-frames:v", "1", "-vf", "scale=320:-2", "-f", "image2pipe", "-c:v", "png", "pipe:1"]
+        try:
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, timeout=15,
+                                    **SPAWN_KWARGS)
+            return Image.open(io.BytesIO(result.stdout)).convert("RGB")
+        except Exception:
+            return None
+    
+    def _apply_preview_frame(self, input_path, frame):
+        if frame is None or input_path != self.input_entry.get():
+            return  # Unreadable, or superseded by a later browse
+        self._preview_source = (input_path, frame)
+        self._render_preview()
+    
+    def _render_preview(self):
+        """Apply the current settings to the sampled frame without running ffmpeg."""
+        if not self._preview_source:
+            return
+        
+        b, c, s, g = self._values()
+        
+        table = [round(v * 255) for v in color_lut_values(b, c, g)]
+        img = self._preview_source[1].point(table * 3)
+        if abs(s - 1) > 1e-6:
+            img = ImageEnhance.Color(img).enhance(s)
+        
+        self._preview_photo = ImageTk.PhotoImage(img)
+        self.frame_preview.configure(image=self._preview_photo)
+    
+    @staticmethod
+    def _probe_color_props(input_path) -> dict:
+        """Color tags of the input's first video stream (runs on the probe pool)."""
+        props = {}
+        info = get_media_info(input_path) or {}
+        stream = next((st for st in info.get("streams", []) if st.get("codec_type") == "video"), {})
+        for key in ("color_space", "color_primaries", "color_transfer"):
+            value = stream.get(key)
+            if value and value != "unknown":
+                props[key] = value
+        return props
+    
+    def _apply_color_props(self, input_path, props):
+        if input_path == self.input_entry.get():
+            self._color_props = (input_path, props)
     
     def build_command(self) -> list:
         input_path = self.input_entry.get()
@@ -177,17 +280,48 @@ class ColorApp(FFmpegToolApp):
         if not input_path or not output_path:
             return None
         
-        b = self.brightness_var.get()
-        c = self.contrast_var.get()
-        s = self.saturation_var.get()
-        g = self.gamma_var.get()
+        b, c, s, g = self._values()
         
-        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
+        # Brightness/contrast/gamma collapse into one table lookup; saturation is a separate pass
+        filters = []
+        if abs(b) > 1e-6 or abs(c - 1) > 1e-6 or abs(g - 1) > 1e-6:
+            lut_escaped = str(build_color_lut(b, c, g)).replace("\\", "/").replace(":", "\\:")
+            filters.append(f"lut1d=file='{lut_escaped}'")
+        if abs(s) < 1e-6:
+            # Dropping chroma is cheaper than scaling it to zero
+            filters.append("format=gray,format=yuv420p")
+        elif abs(s - 1) > 1e-6:
+            filters.append(f"hue=s={s}")
         
-        # Build eq filter
-        eq_filter = f"eq=brightness={b}:contrast={c}:saturation={s}:gamma={g}"
-        cmd.extend(["-vf", eq_filter])
-        cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "copy"])
+        if not filters:
+            # Identity transform: remux instead of re-encoding
+            return [get_binary("ffmpeg"), "-y", "-i", input_path, "-c", "copy", output_path]
+        color_filter = ",".join(filters)
+        
+        # lut1d works in RGB, so the output is always converted back to 8-bit
+        # limited-range 4:2:0 (which also covers yuvj* and 10-bit sources for both
+        # encoders); the source color tags from the browse probe are carried over so
+        # players don't guess (a typed path, or one still probing, goes untagged)
+        props = self._color_props[1] if self._color_props[0] == input_path else {}
+        color_args = ["-color_range", "tv"]
+        for key, option in (("color_space", "-colorspace"), ("color_primaries", "-color_primaries"),
+                            ("color_transfer", "-color_trc")):
+            if key in props:
+                color_args.extend([option, props[key]])
+        
+        n = str(self.threads_var.get())
+        cmd = [get_binary("ffmpeg"), "-y", "-filter_threads", n, "-filter_complex_threads", n]
+        if self.accel_var.get() == "gpu":
+            # Decode and encode on the GPU; decoded frames come down in their native
+            # format (or from the software decoder) for the color pass, and NVENC uploads them
+            cmd.extend(["-hwaccel", "cuda", "-i", input_path])
+            cmd.extend(["-vf", f"{color_filter},format=yuv420p"])
+            cmd.extend(["-c:v", "h264_nvenc", "-preset", "p5", *nvenc_quality_args(23), "-c:a", "copy"])
+        else:
+            cmd.extend(["-threads", "0", "-i", input_path])
+            cmd.extend(["-vf", f"{color_filter},format=yuv420p"])
+            cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "copy"])
+        cmd.extend(color_args)
         cmd.append(output_path)
         
         return cmd
@@ -196,6 +330,18 @@ class ColorApp(FFmpegToolApp):
         cmd = self.build_command()
         if cmd:
             self.set_preview(cmd)
+            if "-vf" not in cmd:
+                self.preview_text.configure(state="normal")
+                self.preview_text.insert("1.0", "ℹ No adjustments set: the video will be stream-copied.\n")
+                self.preview_text.configure(state="disabled")
+            input_path = self.input_entry.get()
+            if HAS_PIL and self._preview_source and self._preview_source[0] == input_path:
+                self._render_preview()
+            elif HAS_PIL:
+                # Sample the frame off the Tk thread (once per input file)
+                future = probe_async(input_path, self._grab_preview_frame)
+                future.add_done_callback(
+                    lambda f: self.root.after(0, self._apply_preview_frame, input_path, f.result()))
         else:
             messagebox.showwarning("Missing Input", "Please select input and output files.")
     
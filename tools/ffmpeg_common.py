@@ -7,9 +7,15 @@ import os
 import sys
 import json
 import subprocess
+import atexit
 import threading
+import collections
 import shutil
 import re
+import copy
+import functools
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from tkinter import filedialog, messagebox
 import tkinter as tk
@@ -24,8 +30,12 @@ BINS_DIR = SCRIPT_DIR.parent / "bins"
 TEMP_DIR = SCRIPT_DIR.parent / "temp"
 CONFIG_PATH = Path.home() / ".ffmpeg_toolbox_config.json"
 
+@functools.lru_cache(maxsize=None)
 def get_binary(name: str) -> str:
-    """Get path to binary, preferring local bins folder."""
+    """Get path to binary, preferring local bins folder.
+    
+    Results are cached; call get_binary.cache_clear() after installing binaries.
+    """
     if os.name == 'nt' and not name.endswith(".exe"):
         name += ".exe"
     
@@ -46,62 +56,324 @@ def ensure_dir(folder: Path):
 # Ensure temp directory exists
 ensure_dir(TEMP_DIR)
 
+# Spawn options for ffmpeg/ffprobe: hide the console window on Windows; on POSIX,
+# close_fds=False lets CPython launch through posix_spawn instead of fork+exec
+if os.name == 'nt':
+    SPAWN_KWARGS = {"creationflags": subprocess.CREATE_NO_WINDOW}
+else:
+    SPAWN_KWARGS = {"close_fds": False}
+
+CAPS_PATH = TEMP_DIR / "ffmpeg_caps.json"
+
+def _parse_caps(hwaccels: str, encoders: str, filters: str) -> dict:
+    """Turn the -hwaccels / -encoders / -filters listings into sets of names."""
+    # -hwaccels: a header line, then one method per line
+    accel_names = {line.strip() for line in hwaccels.splitlines()[1:] if line.strip()}
+    # -encoders: a legend ending in " ------", then " V....D libx264  description"
+    lines = encoders.splitlines()
+    start = next((i for i, line in enumerate(lines) if line.strip().startswith("---")), -1)
+    encoder_names = {parts[1] for parts in map(str.split, lines[start + 1:]) if len(parts) >= 2}
+    # -filters: " ... nlmeans_opencl    V->V       Non-local means denoiser..."
+    filter_names = {parts[1] for parts in map(str.split, filters.splitlines())
+                    if len(parts) >= 3 and "->" in parts[2]}
+    return {"hwaccels": accel_names, "encoders": encoder_names, "filters": filter_names}
+
+@functools.lru_cache(maxsize=None)
+def get_ffmpeg_caps() -> dict:
+    """Hardware accels, encoders and filters of the ffmpeg build, as sets of names.
+    
+    Saved to CAPS_PATH keyed by the binary's path and mtime, so ffmpeg is only
+    run on the first use after it changes. Call get_ffmpeg_caps.cache_clear()
+    after installing binaries.
+    """
+    binary = get_binary("ffmpeg")
+    try:
+        mtime = os.stat(binary).st_mtime
+    except OSError:
+        mtime = None  # Bare name left for PATH lookup at spawn time; don't persist
+    
+    if mtime is not None:
+        try:
+            with open(CAPS_PATH, 'r') as f:
+                saved = json.load(f)
+            if saved.get("binary") == binary and saved.get("mtime") == mtime:
+                return {key: set(saved[key]) for key in ("hwaccels", "encoders", "filters")}
+        except:
+            pass
+    
+    try:
+        listings = [subprocess.run([binary, "-hide_banner", option],
+                                   stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                                   timeout=10, **SPAWN_KWARGS).stdout
+                    for option in ("-hwaccels", "-encoders", "-filters")]
+    except:
+        return {"hwaccels": set(), "encoders": set(), "filters": set()}
+    caps = _parse_caps(*listings)
+    
+    if mtime is not None:
+        try:
+            ensure_dir(TEMP_DIR)
+            tmp_path = CAPS_PATH.with_suffix(".json.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump({"binary": binary, "mtime": mtime,
+                           **{key: sorted(names) for key, names in caps.items()}}, f)
+            os.replace(tmp_path, CAPS_PATH)
+        except:
+            pass
+    return caps
+
+def refresh_ffmpeg_caps() -> dict:
+    """Probe the ffmpeg build again, bypassing both the in-process and the on-disk cache."""
+    get_binary.cache_clear()
+    get_ffmpeg_caps.cache_clear()
+    try:
+        CAPS_PATH.unlink()
+    except OSError:
+        pass
+    return get_ffmpeg_caps()
+
+def has_nvenc() -> bool:
+    """Whether the ffmpeg build lists the NVENC H.264 encoder."""
+    return "h264_nvenc" in get_ffmpeg_caps()["encoders"]
+
+def nvenc_preferred() -> bool:
+    """Whether tools should default to NVENC.
+    
+    The build listing h264_nvenc says nothing about the GPU (release builds always
+    include it), so this also requires NVENC to be chosen in the Hardware Checker.
+    """
+    return load_config().get("hw_accel_method") == "cuda" and has_nvenc()
+
+def has_cuda() -> bool:
+    """Whether the ffmpeg build lists the CUDA hwaccel."""
+    return "cuda" in get_ffmpeg_caps()["hwaccels"]
+
+def has_filter(name: str) -> bool:
+    """Whether the ffmpeg build includes the named filter."""
+    return name in get_ffmpeg_caps()["filters"]
+
+@functools.lru_cache(maxsize=None)
+def ffplay_has_option(name: str) -> bool:
+    """Whether ffplay accepts -<name> (e.g. hwaccel, which only exists from ffplay 7.1)."""
+    try:
+        help_text = subprocess.run([get_binary("ffplay"), "-hide_banner", "-h", "long"],
+                                   stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                                   timeout=10, **SPAWN_KWARGS).stdout
+    except:
+        return False
+    return re.search(rf"^-{re.escape(name)}\s", help_text, re.MULTILINE) is not None
+
+# x264-style preset names mapped to NVENC's p1 (fastest) .. p7 (slowest)
+NVENC_PRESETS = {
+    "ultrafast": "p1", "superfast": "p1", "veryfast": "p2", "faster": "p3",
+    "fast": "p3", "medium": "p4", "slow": "p5", "slower": "p6", "veryslow": "p7",
+}
+
+def nvenc_quality_args(cq) -> list:
+    """Constant-quality NVENC rate control; -b:v 0 lifts the default bitrate cap that would limit -cq."""
+    return ["-rc", "vbr", "-cq", str(cq), "-b:v", "0"]
+
+def encoder_thread_args(codec: str) -> list:
+    """Parallelism options for a video encoder: all cores for CPU codecs, deeper queues for NVENC."""
+    if codec.endswith("_nvenc"):
+        # NVENC's output delay follows the surface count, keeping that many frames in flight
+        return ["-surfaces", "64"]
+    if codec in ("libx264", "libx265", "libvpx-vp9"):
+        cores = os.cpu_count() or 1
+        return ["-threads", str(cores), "-filter_threads", str(max(2, cores // 2))]
+    return []
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
+# In-memory copy of the config file, invalidated when the file's mtime changes
+_CONFIG_CACHE = None
+_CONFIG_MTIME = None
+
+def _config_mtime():
+    try:
+        return CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
 def load_config() -> dict:
     """Load configuration from file."""
-    config = {"theme": "light", "last_dir": str(Path.home())}
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH, 'r') as f:
-                saved = json.load(f)
-                config.update(saved)
-        except:
-            pass
-    return config
+    global _CONFIG_CACHE, _CONFIG_MTIME
+    mtime = _config_mtime()
+    if _CONFIG_CACHE is None or mtime != _CONFIG_MTIME:
+        config = {"theme": "light", "last_dir": str(Path.home()),
+                  "suppress_success_dialog": False}
+        if mtime is not None:
+            try:
+                with open(CONFIG_PATH, 'r') as f:
+                    saved = json.load(f)
+                    config.update(saved)
+            except:
+                pass
+        _CONFIG_CACHE = config
+        _CONFIG_MTIME = mtime
+    return dict(_CONFIG_CACHE)
 
 def save_config(new_data: dict):
-    """Save configuration to file (merging with existing)."""
+    """Save configuration to file (merging with existing).
+    
+    The in-memory config is updated immediately; the file is written atomically
+    on a background timer, restarted by every save, so a burst of saves costs
+    one write and the UI never waits on disk I/O.
+    """
+    global _CONFIG_CACHE, _CONFIG_DIRTY, _CONFIG_TIMER
     current = load_config()
     current.update(new_data)
-    try:
-        with open(CONFIG_PATH, 'w') as f:
-            json.dump(current, f)
-    except:
-        pass
+    _CONFIG_CACHE = current
+    _CONFIG_DIRTY = True
+    with _CONFIG_TIMER_LOCK:
+        if _CONFIG_TIMER is not None:
+            _CONFIG_TIMER.cancel()
+        _CONFIG_TIMER = threading.Timer(CONFIG_SAVE_DELAY, _persist_config)
+        _CONFIG_TIMER.daemon = True
+        _CONFIG_TIMER.start()
+
+# Seconds of quiet after the last save_config before the file is written
+CONFIG_SAVE_DELAY = 0.5
+
+_CONFIG_LOCK = threading.Lock()
+_CONFIG_DIRTY = False
+_CONFIG_TIMER = None
+_CONFIG_TIMER_LOCK = threading.Lock()
+
+def _persist_config():
+    """Write the latest in-memory config to disk if it has unsaved changes."""
+    global _CONFIG_MTIME, _CONFIG_DIRTY
+    with _CONFIG_LOCK:
+        if not _CONFIG_DIRTY:
+            return
+        _CONFIG_DIRTY = False
+        tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(dict(_CONFIG_CACHE), f)
+            os.replace(tmp_path, CONFIG_PATH)
+            _CONFIG_MTIME = _config_mtime()
+        except:
+            pass
+
+# Don't lose a save still pending when the process exits
+atexit.register(_persist_config)
 
 # ============================================================================
 # Media Info (FFprobe)
 # ============================================================================
 
-def get_media_duration(filepath: str) -> float | None:
-    """Get media duration in seconds using ffprobe."""
-    try:
-        cmd = [get_binary("ffprobe"), "-v", "quiet", "-show_entries", "format=duration",
-               "-of", "default=noprint_wrappers=1:nokey=1", filepath]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10,
-                                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0)
-        if result.returncode == 0:
-            return float(result.stdout.strip())
-    except:
-        pass
-    return None
+def _probe(filepath: str, st: os.stat_result = None) -> dict | None:
+    """Return ffprobe's format + stream JSON for a file, probing each file version once.
+    
+    Pass `st` when the caller already has the file's stat result.
+    """
+    if st is None:
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            # Not a local file (URL, device, ...): probe without caching
+            return _probe_cached.__wrapped__(filepath, None, None)
+    return _probe_cached(filepath, st.st_mtime_ns, st.st_size)
 
-def get_media_info(filepath: str) -> dict | None:
-    """Get detailed media info using ffprobe as JSON."""
+@functools.lru_cache(maxsize=256)
+def _probe_cached(filepath: str, mtime_ns: int, size: int) -> dict | None:
+    """Run ffprobe once; cached per (path, mtime, size)."""
     try:
         cmd = [get_binary("ffprobe"), "-v", "quiet", "-print_format", "json",
                "-show_format", "-show_streams", filepath]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10,
-                                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0)
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                                timeout=10, **SPAWN_KWARGS)
         if result.returncode == 0:
             return json.loads(result.stdout)
     except:
         pass
     return None
 
+# Small fixed field set for tools that only need resolution/codec/duration
+MediaFields = collections.namedtuple("MediaFields", "width height codec_name duration")
+
+def probe_fields(filepath: str) -> MediaFields | None:
+    """Probe first-video-stream size/codec and duration without the full JSON dump."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return _probe_fields_cached.__wrapped__(filepath, None, None)
+    return _probe_fields_cached(filepath, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=256)
+def _probe_fields_cached(filepath: str, mtime_ns: int, size: int) -> MediaFields | None:
+    """Run a flat key=value ffprobe query; cached per (path, mtime, size)."""
+    try:
+        cmd = [get_binary("ffprobe"), "-v", "quiet", "-select_streams", "v:0",
+               "-show_entries", "stream=width,height,codec_name,duration:format=duration",
+               "-of", "flat=s=_", filepath]
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                                timeout=10, **SPAWN_KWARGS)
+        if result.returncode != 0:
+            return None
+    except:
+        return None
+    
+    # Lines look like streams_stream_0_width=1920 and format_duration="12.5"
+    fields = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition("=")
+        fields[key] = value.strip('"')
+    
+    def number(key, cast):
+        try:
+            return cast(fields[key])
+        except (KeyError, ValueError):
+            return None
+    
+    # Some containers only carry a duration on the stream
+    duration = number("format_duration", float) or number("streams_stream_0_duration", float)
+    return MediaFields(number("streams_stream_0_width", int), number("streams_stream_0_height", int),
+                       fields.get("streams_stream_0_codec_name"), duration)
+
+_PROBE_POOL = None
+_PROBE_POOL_LOCK = threading.Lock()
+
+def _probe_pool() -> ThreadPoolExecutor:
+    global _PROBE_POOL
+    with _PROBE_POOL_LOCK:
+        if _PROBE_POOL is None:
+            # Each probe is a separate ffprobe process, so threads overlap their startup
+            _PROBE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ffprobe")
+    return _PROBE_POOL
+
+def probe_many(paths, probe=None) -> list:
+    """Probe several files concurrently (defaults to probe_fields); results keep input order."""
+    probe = probe or probe_fields
+    paths = list(paths)
+    if len(paths) < 2:
+        return [probe(p) for p in paths]
+    return list(_probe_pool().map(probe, paths))
+
+def probe_async(path: str, probe=None) -> Future:
+    """Run a probe (defaults to probe_fields) on the shared pool instead of the Tk thread.
+    
+    Callbacks added to the returned future run on a pool thread; hop back with root.after.
+    """
+    return _probe_pool().submit(probe or probe_fields, path)
+
+def get_media_duration(filepath: str, st: os.stat_result = None) -> float | None:
+    """Get media duration in seconds using ffprobe."""
+    info = _probe(filepath, st)
+    try:
+        return float(info["format"]["duration"])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+def get_media_info(filepath: str) -> dict | None:
+    """Get detailed media info using ffprobe as JSON."""
+    info = _probe(filepath)
+    # Callers get their own copy so the cached result stays intact
+    return copy.deepcopy(info) if info is not None else None
+
 def format_duration(seconds: float) -> str:
     """Format seconds as HH:MM:SS."""
     if seconds is None:
@@ -111,6 +383,33 @@ def format_duration(seconds: float) -> str:
     s = int(seconds % 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
+def format_size(num_bytes: int) -> str:
+    """Format a byte count as MB (or GB above 1024 MB)."""
+    mb = num_bytes / 1048576
+    if mb >= 1024:
+        return f"{mb / 1024:.2f} GB"
+    return f"{mb:.1f} MB"
+
+# Rough encode cost in seconds per second of 1080p media at the "medium" preset
+_ENCODE_COST = {
+    "libx264": 1.0, "libx265": 4.0, "libvpx-vp9": 3.0,
+    "h264_nvenc": 0.15, "hevc_nvenc": 0.2, "h264_qsv": 0.25, "hevc_qsv": 0.3,
+    "copy": 0.01,
+}
+_PRESET_COST = {
+    "ultrafast": 0.25, "superfast": 0.35, "veryfast": 0.5, "faster": 0.7, "fast": 0.85,
+    "medium": 1.0, "slow": 1.6, "slower": 3.0, "veryslow": 6.0,
+}
+
+def estimate_encode_time(codec: str, preset: str, duration: float) -> float | None:
+    """Ballpark encode time in seconds; None when the duration is unknown."""
+    if not duration:
+        return None
+    cost = _ENCODE_COST.get(codec, 1.0)
+    if codec in ("libx264", "libx265"):
+        cost *= _PRESET_COST.get(preset, 1.0)
+    return duration * cost
+
 def parse_time_to_seconds(time_str: str) -> float:
     """Parse HH:MM:SS or SS format to seconds."""
     try:
@@ -128,6 +427,50 @@ def parse_time_to_seconds(time_str: str) -> float:
 # FFmpeg Runner (Threaded with Progress)
 # ============================================================================
 
+# FFmpeg stats lines are terminated by "\r", log lines by "\n"
+_NEWLINE_RE = re.compile(rb'\r\n|\r|\n')
+
+# Keys emitted by "-progress"; each block ends with a "progress=" line
+_PROGRESS_KEYS = frozenset((
+    b"frame", b"fps", b"bitrate", b"total_size", b"out_time_us", b"out_time_ms",
+    b"out_time", b"dup_frames", b"drop_frames", b"speed", b"progress",
+))
+
+def _with_progress_args(cmd: list) -> list:
+    """Ask ffmpeg for structured key=value progress on stdout instead of stats lines."""
+    if len(cmd) > 1 and Path(cmd[0]).stem.lower() == "ffmpeg" and "-progress" not in cmd:
+        return [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+    return cmd
+
+def _iter_output_chunks(stream, should_stop=None):
+    """Yield up to 64 KiB chunks from a binary pipe until EOF or should_stop() is true.
+    
+    Reads block until ffmpeg writes something, so an idle encode costs no CPU.
+    FFmpegRunner.stop() terminates the process, which closes the pipe and ends
+    the read; no timed wake-ups are needed to notice a stop request.
+    """
+    while not (should_stop and should_stop()):
+        chunk = stream.read1(65536)
+        if not chunk:
+            return
+        yield chunk
+
+def _iter_output_lines(stream, should_stop=None):
+    """Yield raw output lines (newline-terminated bytes) from a binary pipe."""
+    pending = b""
+    for chunk in _iter_output_chunks(stream, should_stop):
+        pending += chunk
+        # A trailing "\r" may be the first half of a "\r\n" split across reads
+        held_cr = pending.endswith(b"\r")
+        *lines, pending = _NEWLINE_RE.split(pending[:-1] if held_cr else pending)
+        if held_cr:
+            pending += b"\r"
+        for line in lines:
+            yield line + b"\n"
+    pending = pending.rstrip(b"\r")
+    if pending:
+        yield pending + b"\n"
+
 class FFmpegRunner:
     """Runs FFmpeg in a background thread with progress updates."""
     
@@ -139,6 +482,7 @@ class FFmpegRunner:
         self.thread = None
         self.total_duration = None
         self._stop_flag = False
+        self._progress_block = {}
     
     def run(self, cmd: list, input_file: str = None):
         """Start FFmpeg command in background thread."""
@@ -161,32 +505,37 @@ class FFmpegRunner:
     def _run_thread(self, cmd: list):
         """Internal thread function."""
         try:
+            cmd = _with_progress_args(cmd)
+            self._progress_block = {}
             if self.on_log:
                 self.on_log(f"$ {' '.join(cmd)}\n")
             
             # Start process
-            creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 stdin=subprocess.PIPE,
-                text=True,
-                creationflags=creationflags
+                bufsize=1024 * 1024,
+                **SPAWN_KWARGS
             )
             
-            # Read output line by line
-            for line in self.process.stdout:
+            # Read output line by line; bytes are only decoded for the log
+            for line in _iter_output_lines(self.process.stdout, lambda: self._stop_flag):
                 if self._stop_flag:
-                    self.process.terminate()
                     break
                 
-                if self.on_log:
-                    self.on_log(line)
-                
-                # Parse progress
-                self._parse_progress(line)
+                # Progress keys are summarized by _parse_progress; everything else is logged
+                if not self._parse_progress(line) and self.on_log:
+                    self.on_log(line.decode("utf-8", errors="replace"))
             
+            if self._stop_flag:
+                self.process.terminate()
+                try:
+                    # ffmpeg finalizes the output on terminate; don't let a stuck device hang the stop
+                    self.process.wait(timeout=3)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
             self.process.wait()
             
             if self._stop_flag:
@@ -207,18 +556,27 @@ class FFmpegRunner:
         finally:
             self.process = None
     
-    def _parse_progress(self, text: str):
-        """Parse FFmpeg output to extract progress percentage."""
-        if not self.total_duration or not self.on_progress:
-            return
+    def _parse_progress(self, line: bytes) -> bool:
+        """Consume a "-progress" key=value line; return False for ordinary log output."""
+        key, sep, value = line.strip().partition(b"=")
+        if not sep or (key not in _PROGRESS_KEYS and not key.startswith(b"stream_")):
+            return False
         
-        # Look for "time=HH:MM:SS.ms" pattern
-        match = re.search(r'time=(\d+):(\d+):(\d+)\.(\d+)', text)
-        if match:
-            h, m, s, ms = map(int, match.groups())
-            current = h * 3600 + m * 60 + s + ms / 100.0
-            percent = int((current / self.total_duration) * 100)
-            self.on_progress(min(percent, 99))
+        self._progress_block[key] = value
+        if key == b"out_time_us":
+            if self.total_duration and self.on_progress and value.isdigit():
+                current = int(value) / 1_000_000
+                percent = int((current / self.total_duration) * 100)
+                self.on_progress(min(percent, 99))
+        elif key == b"progress":
+            # One compact status line per update instead of the raw block
+            block = {k.decode(): v.decode("utf-8", errors="replace")
+                     for k, v in self._progress_block.items()}
+            self._progress_block = {}
+            if self.on_log and value != b"end":
+                self.on_log(f"frame={block.get('frame', '?')} fps={block.get('fps', '?')} "
+                            f"time={block.get('out_time', '?')} speed={block.get('speed', '?')}\n")
+        return True
     
     def is_running(self) -> bool:
         """Check if FFmpeg is currently running."""
@@ -237,7 +595,7 @@ class FFmpegRunner:
         """Send input to stdin."""
         if self.process and self.process.stdin:
             try:
-                self.process.stdin.write(text)
+                self.process.stdin.write(text.encode("utf-8"))
                 self.process.stdin.flush()
             except:
                 pass
@@ -282,10 +640,21 @@ def get_theme() -> dict:
     theme_name = config.get("theme", "light")
     return THEMES.get(theme_name, THEMES["light"])
 
+# Name of the theme whose ttk styles are currently configured (styles are interpreter-wide)
+_STYLED_THEME = None
+
 def apply_theme(root: tk.Tk):
     """Apply theme to Tkinter window."""
+    global _STYLED_THEME
     theme = get_theme()
     
+    # Root window
+    root.configure(bg=theme["bg"])
+    
+    if _STYLED_THEME is theme:
+        return
+    _STYLED_THEME = theme
+    
     style = ttk.Style()
     style.theme_use('clam')
     
@@ -303,9 +672,6 @@ def apply_theme(root: tk.Tk):
     
     # Title label style
     style.configure("Title.TLabel", font=("Segoe UI", 12, "bold"), foreground=theme["accent"])
-    
-    # Root window
-    root.configure(bg=theme["bg"])
 
 def create_card(parent, title: str = None) -> ttk.Frame:
     """Create a styled card frame with optional title."""
@@ -320,6 +686,23 @@ def create_card(parent, title: str = None) -> ttk.Frame:
     
     return outer
 
+def create_entry_row(parent, fields, width: int = 8) -> list:
+    """Pack a row of labelled entries; fields is ((label, default), ...).
+    
+    Returns the entries in the same order so callers can unpack them.
+    """
+    row = ttk.Frame(parent)
+    row.pack(fill="x", pady=5)
+    
+    entries = []
+    for i, (label, default) in enumerate(fields):
+        ttk.Label(row, text=label).pack(side="left", padx=(20, 0) if i else 0)
+        entry = ttk.Entry(row, width=width)
+        entry.insert(0, default)
+        entry.pack(side="left", padx=5)
+        entries.append(entry)
+    return entries
+
 def browse_file(entry: ttk.Entry, filetypes=None):
     """Open file dialog and set entry value."""
     if filetypes is None:
@@ -334,6 +717,19 @@ def browse_file(entry: ttk.Entry, filetypes=None):
         entry.insert(0, filepath)
         save_config({"last_dir": str(Path(filepath).parent)})
 
+def browse_files(filetypes=None) -> list:
+    """Open a multi-select file dialog and return the chosen paths."""
+    if filetypes is None:
+        filetypes = [("All files", "*.*")]
+    
+    config = load_config()
+    initial_dir = config.get("last_dir", str(Path.home()))
+    
+    filepaths = list(filedialog.askopenfilenames(initialdir=initial_dir, filetypes=filetypes))
+    if filepaths:
+        save_config({"last_dir": str(Path(filepaths[0]).parent)})
+    return filepaths
+
 def browse_folder(entry: ttk.Entry):
     """Open folder dialog and set entry value."""
     config = load_config()
@@ -369,6 +765,48 @@ def generate_output_path(input_path: str, suffix: str, new_ext: str = None) -> s
     ext = new_ext if new_ext else p.suffix
     return str(p.parent / f"{p.stem}{suffix}{ext}")
 
+# Numbers each segment_jobs call; tools share one process, so the pid alone can collide
+_SEGMENT_RUNS = itertools.count()
+
+def segment_jobs(cmd: list, duration: float, count: int):
+    """Split a single-input encode into `count` time ranges for FFmpegToolApp.run_parallel.
+    
+    `cmd` must read one input via "-i" and end with the output path. Each segment
+    encodes video only into TEMP_DIR; the final command joins them with the concat
+    demuxer and copies the audio back from the source in one piece, so no audio
+    packets are split at segment boundaries.
+    Returns (jobs, final, temp_files) matching run_parallel's jobs/final/cleanup.
+    """
+    i = cmd.index("-i")
+    input_path, output_path = cmd[i + 1], cmd[-1]
+    ext = Path(output_path).suffix or ".mp4"
+    # Millisecond boundaries shared by neighbouring segments, so none overlap or leave a gap
+    starts = [round(duration * n / count, 3) for n in range(count)]
+    run_id = f"{os.getpid()}_{next(_SEGMENT_RUNS)}"
+    
+    jobs, temp_files, lines = [], [], []
+    for n, start in enumerate(starts):
+        part = str(TEMP_DIR / f"segment_{run_id}_{n}{ext}")
+        # Input-side seek; the last segment runs to the end of the file
+        limit = ["-t", f"{starts[n + 1] - start:.3f}"] if n < count - 1 else []
+        jobs.append((f"segment {n + 1}/{count}",
+                     cmd[:i] + ["-ss", f"{start:.3f}"] + cmd[i:i + 2] + limit
+                     + cmd[i + 2:-1] + ["-an", part]))
+        temp_files.append(part)
+        escaped = part.replace("'", "'\\''")
+        lines.append(f"file '{escaped}'\n")
+    
+    list_file = TEMP_DIR / f"segments_{run_id}.txt"
+    list_file.write_text("".join(lines), encoding="utf-8")
+    temp_files.append(str(list_file))
+    
+    # faststart only means something to the MP4/MOV muxer
+    faststart = ["-movflags", "+faststart"] if ext.lower() in (".mp4", ".mov", ".m4v") else []
+    final = ("join", [cmd[0], "-y", "-f", "concat", "-safe", "0", "-i", str(list_file),
+                      "-i", input_path, "-map", "0:v", "-map", "1:a?", "-c", "copy",
+                      *faststart, output_path])
+    return jobs, final, temp_files
+
 # ============================================================================
 # Drag & Drop Support (Windows)
 # ============================================================================
@@ -383,11 +821,24 @@ def enable_dnd(widget, entry: ttk.Entry):
 # Base Application Class
 # ============================================================================
 
+# One hidden Tk root per process; each tool window is a Toplevel of it
+_ROOT = None
+_MAINLOOP_RUNNING = False
+
+def _shared_root() -> tk.Tk:
+    """Return the process-wide hidden Tk root, creating it on first use."""
+    global _ROOT
+    if _ROOT is None:
+        _ROOT = tk.Tk()
+        _ROOT.withdraw()
+    return _ROOT
+
 class FFmpegToolApp:
     """Base class for FFmpeg tool applications."""
     
     def __init__(self, title: str, width: int = 600, height: int = 500):
-        self.root = tk.Tk()
+        self.root = tk.Toplevel(_shared_root())
+        self.root.protocol("WM_DELETE_WINDOW", self._close_window)
         self.root.title(f"🎬 {title}")
         self.root.geometry(f"{width}x{height}")
         self.root.minsize(500, 400)
@@ -408,25 +859,74 @@ class FFmpegToolApp:
         self.preview_text = None
         self.run_btn = None
         self.status_label = None
+        
+        # Log lines and progress are buffered by worker threads and flushed
+        # to the widgets by a single scheduled Tk callback
+        self._log_queue = collections.deque()
+        # Only the most recent log lines are kept; see _drain_log
+        self._log_ring = collections.deque(maxlen=2000)
+        self._log_shown = 0
+        self._pending_pct = None
+        self._flush_lock = threading.Lock()
+        self._flush_pending = False
+        
+        # Processes of a run_parallel batch (None when no batch is running)
+        self._batch_procs = None
+        self._batch_stop = False
+        self._batch_lock = threading.Lock()
+    
+    def _schedule_flush(self):
+        """Schedule one UI flush unless one is already pending."""
+        with self._flush_lock:
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+        self.root.after(50, self._drain_log)
     
     def _on_progress(self, percent: int):
         """Handle progress updates (thread-safe)."""
         if self.progress_bar:
-            self.root.after(0, lambda: self.progress_bar.configure(value=percent))
+            self._pending_pct = percent
+            self._schedule_flush()
     
     def _on_log(self, text: str):
         """Handle log messages (thread-safe)."""
         if self.log_text:
-            def update():
-                self.log_text.configure(state="normal")
-                self.log_text.insert(tk.END, text)
-                self.log_text.see(tk.END)
-                self.log_text.configure(state="disabled")
-            self.root.after(0, update)
+            self._log_queue.append(text)
+            self._schedule_flush()
+    
+    def _drain_log(self):
+        """Flush buffered log lines and the latest progress value in one pass."""
+        with self._flush_lock:
+            self._flush_pending = False
+        
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        
+        if lines and self.log_text:
+            self._log_ring.extend(lines)
+            self.log_text.configure(state="normal")
+            if self._log_shown + len(lines) > 2 * self._log_ring.maxlen:
+                # Widget has grown to twice the ring size: replace it with the ring
+                self.log_text.delete("1.0", tk.END)
+                self.log_text.insert(tk.END, "".join(self._log_ring))
+                self._log_shown = len(self._log_ring)
+            else:
+                self.log_text.insert(tk.END, "".join(lines))
+                self._log_shown += len(lines)
+            self.log_text.see(tk.END)
+            self.log_text.configure(state="disabled")
+        
+        percent, self._pending_pct = self._pending_pct, None
+        if percent is not None and self.progress_bar:
+            self.progress_bar.configure(value=percent)
     
     def _on_finished(self, success: bool, message: str):
         """Handle completion (thread-safe)."""
         def update():
+            # Flush remaining output so a stale progress value can't land after completion
+            self._drain_log()
             if self.run_btn:
                 self.run_btn.configure(state="normal")
             if self.status_label:
@@ -437,9 +937,14 @@ class FFmpegToolApp:
                 self.progress_bar.configure(value=100 if success else 0)
             
             if success:
-                messagebox.showinfo("Complete", message)
+                # The status label already reports success; a modal would stall bulk runs
+                if load_config().get("suppress_success_dialog", False):
+                    self.root.bell()
+                else:
+                    self.root.after_idle(messagebox.showinfo, "Complete", message)
             else:
-                messagebox.showerror("Error", message)
+                # Let the final log flush paint before the modal grabs the window
+                self.root.after_idle(messagebox.showerror, "Error", message)
         
         self.root.after(0, update)
     
@@ -453,16 +958,18 @@ class FFmpegToolApp:
     
     def clear_log(self):
         """Clear log text."""
+        self._log_ring.clear()
+        self._log_shown = 0
         if self.log_text:
             self.log_text.configure(state="normal")
             self.log_text.delete("1.0", tk.END)
             self.log_text.configure(state="disabled")
     
-    def run_command(self, cmd: list, input_file: str = None):
-        """Run FFmpeg command."""
-        if self.runner.is_running():
+    def _start_busy(self) -> bool:
+        """Reset the log/progress widgets for a new run; False if one is already running."""
+        if self.runner.is_running() or self._batch_procs is not None:
             messagebox.showwarning("Busy", "Please wait for current operation to complete.")
-            return
+            return False
         
         self.clear_log()
         if self.run_btn:
@@ -471,12 +978,104 @@ class FFmpegToolApp:
             self.status_label.configure(text="Processing...", foreground=get_theme()["fg"])
         if self.progress_bar:
             self.progress_bar.configure(value=0)
+        return True
+    
+    def run_command(self, cmd: list, input_file: str = None):
+        """Run FFmpeg command."""
+        if self._start_busy():
+            self.runner.run(cmd, input_file)
+    
+    def run_parallel(self, jobs: list, max_workers: int = None, final: tuple = None,
+                     cleanup=(), unit: str = "files"):
+        """Run independent FFmpeg commands concurrently; jobs is a list of (label, cmd).
+        
+        Progress counts finished jobs; each job logs one line when it ends.
+        `final` is an optional (label, cmd) run once every job has succeeded, and
+        the paths in `cleanup` are deleted at the end whatever the outcome.
+        """
+        if not jobs or not self._start_busy():
+            return
+        workers = max_workers or max(1, min(len(jobs), (os.cpu_count() or 2) // 2))
+        self._batch_procs = set()
+        self._batch_stop = False
+        threading.Thread(target=self._run_parallel_thread,
+                         args=(jobs, workers, final, cleanup, unit), daemon=True).start()
+    
+    def _run_parallel_thread(self, jobs, workers, final=None, cleanup=(), unit="files"):
+        lock = self._batch_lock
+        
+        def run_one(cmd):
+            with lock:
+                if self._batch_stop:
+                    return None, b""
+                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, **SPAWN_KWARGS)
+                self._batch_procs.add(proc)
+            _, err = proc.communicate()
+            with lock:
+                self._batch_procs.discard(proc)
+            return proc.returncode, err
+        
+        def log_result(label, code, err):
+            if code is None:
+                self._on_log(f"[{label}] skipped\n")
+            elif code == 0:
+                self._on_log(f"[{label}] done\n")
+            else:
+                tail = err.decode("utf-8", errors="replace").strip().splitlines()[-1:] or [""]
+                self._on_log(f"[{label}] failed ({code}): {tail[0]}\n")
         
-        self.runner.run(cmd, input_file)
+        self._on_log(f"Processing {len(jobs)} {unit} with {workers} workers\n")
+        failed = 0
+        final_code = 0
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(run_one, cmd): label for label, cmd in jobs}
+                for done, future in enumerate(as_completed(futures), 1):
+                    label = futures[future]
+                    try:
+                        code, err = future.result()
+                    except Exception as e:
+                        code, err = -1, str(e).encode()
+                    if code not in (None, 0):
+                        failed += 1
+                    log_result(label, code, err)
+                    self._on_progress(done * 100 // len(jobs))
+            
+            if final and not failed and not self._batch_stop:
+                final_code, err = run_one(final[1])
+                log_result(final[0], final_code, err)
+        finally:
+            with lock:
+                self._batch_procs = None
+            for path in cleanup:
+                try:
+                    os.remove(path)
+                except:
+                    pass
+        
+        if self._batch_stop:
+            self._on_finished(False, "Cancelled by user")
+        elif failed:
+            self._on_finished(False, f"{failed} of {len(jobs)} {unit} failed")
+        elif final_code:
+            self._on_finished(False, f"{final[0]} failed")
+        else:
+            self._on_finished(True, f"Processed {len(jobs)} {unit}")
     
     def stop_command(self):
         """Stop running command."""
         self.runner.stop()
+        with self._batch_lock:
+            if self._batch_procs is None:
+                return
+            # Queued jobs see the flag and skip; running ones are terminated
+            self._batch_stop = True
+            for proc in self._batch_procs:
+                try:
+                    proc.terminate()
+                except:
+                    pass
     
     def send_command_input(self, text: str):
         """Send input to running command."""
@@ -517,8 +1116,29 @@ class FFmpegToolApp:
         self.progress_bar = ttk.Progressbar(status_frame, mode="determinate", length=300)
         self.progress_bar.pack(side="right", padx=(10, 0))
         
+        # Shared by every tool through the config file
+        quiet = tk.BooleanVar(master=self.root, value=load_config().get("suppress_success_dialog", False))
+        ttk.Checkbutton(status_frame, text="No completion popup", variable=quiet,
+                        command=lambda: save_config({"suppress_success_dialog": quiet.get()})
+                        ).pack(side="right")
+        
         return bottom
     
+    def _close_window(self):
+        """Destroy this tool window; shut down the shared root with the last one."""
+        global _ROOT
+        self.root.destroy()
+        if _ROOT is not None and not any(isinstance(w, tk.Toplevel) for w in _ROOT.winfo_children()):
+            _ROOT.destroy()
+            _ROOT = None
+    
     def run(self):
-        """Start the application main loop."""
-        self.root.mainloop()
+        """Start the application main loop (no-op if it is already running)."""
+        global _MAINLOOP_RUNNING
+        if _MAINLOOP_RUNNING:
+            return
+        _MAINLOOP_RUNNING = True
+        try:
+            _shared_root().mainloop()
+        finally:
+            _MAINLOOP_RUNNING = False
@@ -3,25 +3,35 @@ FFmpeg Compress Tool
 Compress video files with quality control
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
-from pathlib import Path
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
-    generate_output_path, browse_file, browse_save_file, create_card, get_theme
+    FFmpegToolApp, get_binary, get_media_duration, format_duration, format_size,
+    estimate_encode_time, probe_async, encoder_thread_args, TEMP_DIR,
+    nvenc_preferred, nvenc_quality_args, NVENC_PRESETS,
+    generate_output_path, browse_file, browse_save_file, create_card
 )
 
 class CompressApp(FFmpegToolApp):
     """Video compression tool."""
     
+    # Quality label for CRF 18..40, indexed by crf - 18
+    _CRF_QUALITY = ("Excellent",) * 5 + ("Good",) * 5 + ("Medium",) * 5 + ("Low",) * 8
+    
     def __init__(self):
         super().__init__("FFmpeg Compress", width=650, height=600)
+        # (path, duration) from the last browse, reused by target-size mode
+        self._cached_duration = (None, None)
+        self._crf_after_id = None
+        # pass_num -> (option key, command) of the last build
+        self._cmd_cache = {}
+        # 2-pass stats prefix; per window, since every tool shares one process
+        self._passlog = TEMP_DIR / f"compress_2pass_{os.getpid()}_{id(self):x}"
         self.build_ui()
     
     def build_ui(self):
-        theme = get_theme()
-        
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill="both", expand=True)
         
@@ -47,6 +57,7 @@ class CompressApp(FFmpegToolApp):
         # Mode selection
         mode_row = ttk.Frame(options_card)
         mode_row.pack(fill="x", pady=5)
+        self._mode_anchor = mode_row  # CRF / size rows are re-packed right after it
         
         ttk.Label(mode_row, text="Mode:").pack(side="left")
         self.mode_var = tk.StringVar(value="crf")
@@ -80,7 +91,7 @@ class CompressApp(FFmpegToolApp):
         codec_row.pack(fill="x", pady=5)
         
         ttk.Label(codec_row, text="Codec:").pack(side="left")
-        self.codec_var = tk.StringVar(value="libx264")
+        self.codec_var = tk.StringVar(value="h264_nvenc" if nvenc_preferred() else "libx264")
         codec_combo = ttk.Combobox(codec_row, textvariable=self.codec_var, width=15,
                                    values=["libx264", "libx265", "h264_nvenc", "hevc_nvenc"])
         codec_combo.pack(side="left", padx=5)
@@ -90,7 +101,7 @@ class CompressApp(FFmpegToolApp):
         preset_row.pack(fill="x", pady=5)
         
         ttk.Label(preset_row, text="Preset:").pack(side="left")
-        self.preset_var = tk.StringVar(value="medium")
+        self.preset_var = tk.StringVar(value="faster")
         preset_combo = ttk.Combobox(preset_row, textvariable=self.preset_var, width=12,
                                     values=["ultrafast", "superfast", "veryfast", "faster",
                                             "fast", "medium", "slow", "slower", "veryslow"])
@@ -98,6 +109,11 @@ class CompressApp(FFmpegToolApp):
         ttk.Label(preset_row, text="(slower = better quality at same size)", 
                   foreground="gray").pack(side="left", padx=10)
         
+        self.estimate_label = ttk.Label(options_card, text="", foreground="gray")
+        self.estimate_label.pack(anchor="w")
+        self.codec_var.trace_add("write", lambda *_: self._update_estimate())
+        self.preset_var.trace_add("write", lambda *_: self._update_estimate())
+        
         # Audio options
         audio_row = ttk.Frame(options_card)
         audio_row.pack(fill="x", pady=5)
@@ -142,82 +158,138 @@ class CompressApp(FFmpegToolApp):
         
         input_path = self.input_entry.get()
         if input_path:
-            # Get duration and file size
-            duration = get_media_duration(input_path)
+            # Get duration and file size from a single stat
             try:
-                size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-                size_str = f"{size_mb:.1f} MB"
-            except:
+                st = os.stat(input_path)
+                size_str = format_size(st.st_size)
+            except OSError:
+                st = None
                 size_str = "--"
+            self.info_label.configure(text=f"Duration: --:--:-- | Size: {size_str}")
             
-            dur_str = format_duration(duration) if duration else "--:--:--"
-            self.info_label.configure(text=f"Duration: {dur_str} | Size: {size_str}")
+            # Probe off the Tk thread so slow (e.g. network) files don't freeze the window
+            future = probe_async(input_path, lambda p: get_media_duration(p, st))
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._on_duration, input_path, size_str, f.result()))
             
             # Auto-generate output
             output_path = generate_output_path(input_path, "_compressed")
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, output_path)
     
+    def _on_duration(self, input_path, size_str, duration):
+        if input_path != self.input_entry.get():
+            return  # A different file was picked meanwhile
+        self._cached_duration = (input_path, duration)
+        self._update_estimate()
+        dur_str = format_duration(duration) if duration else "--:--:--"
+        self.info_label.configure(text=f"Duration: {dur_str} | Size: {size_str}")
+    
     def _browse_output(self):
         filetypes = [("MP4 files", "*.mp4"), ("All files", "*.*")]
         browse_save_file(self.output_entry, filetypes, ".mp4")
     
+    def _update_estimate(self):
+        """Show a ballpark encode time so slow codec/preset picks are visible up front."""
+        runtime = estimate_encode_time(self.codec_var.get(), self.preset_var.get(),
+                                       self._cached_duration[1])
+        text = f"Estimated: ~{format_duration(runtime)} on this machine" if runtime else ""
+        self.estimate_label.configure(text=text)
+    
     def _on_mode_changed(self):
         if self.mode_var.get() == "crf":
-            self.crf_frame.pack(fill="x", pady=5, after=self.crf_frame.master.winfo_children()[1])
+            self.crf_frame.pack(fill="x", pady=5, after=self._mode_anchor)
             self.size_frame.pack_forget()
         else:
-            self.size_frame.pack(fill="x", pady=5, after=self.crf_frame.master.winfo_children()[1])
+            self.size_frame.pack(fill="x", pady=5, after=self._mode_anchor)
             self.crf_frame.pack_forget()
     
     def _update_crf_label(self, value):
+        # Scale fires on every pixel of a drag; only render the value it settles on
+        if self._crf_after_id:
+            self.root.after_cancel(self._crf_after_id)
+        self._crf_after_id = self.root.after(30, self._apply_crf_label, value)
+    
+    def _apply_crf_label(self, value):
+        self._crf_after_id = None
         crf = int(float(value))
-        quality_map = {
-            (18, 22): "Excellent",
-            (23, 27): "Good",
-            (28, 32): "Medium",
-            (33, 40): "Low"
-        }
-        quality = "Medium"
-        for (low, high), label in quality_map.items():
-            if low <= crf <= high:
-                quality = label
-                break
+        quality = self._CRF_QUALITY[max(0, min(22, crf - 18))]
         self.crf_label.configure(text=f"{crf} ({quality})")
     
-    def build_command(self) -> list:
+    def build_command(self, pass_num=2) -> list:
+        """Build the encode command; pass_num=1 gives the analysis pass of a 2-pass encode.
+        
+        Returns None for pass 1 when the current settings encode in a single pass.
+        The result is reused while every option that feeds it is unchanged.
+        """
+        key = (self.input_entry.get(), self.output_entry.get(), self.mode_var.get(),
+               self.crf_var.get(), self.codec_var.get(), self.preset_var.get(),
+               self.audio_var.get(), self.size_entry.get(), self._cached_duration)
+        cached_key, cmd = self._cmd_cache.get(pass_num, (None, None))
+        if key != cached_key:
+            cmd = self._build_command(pass_num)
+            self._cmd_cache[pass_num] = (key, cmd)
+        return cmd
+    
+    def _build_command(self, pass_num) -> list:
         input_path = self.input_entry.get()
         output_path = self.output_entry.get()
         
         if not input_path or not output_path:
             return None
         
-        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
-        
         codec = self.codec_var.get()
         preset = self.preset_var.get()
+        nvenc = codec.endswith("_nvenc")
+        
+        cmd = [get_binary("ffmpeg"), "-y"]
+        if nvenc:
+            # Decode on the GPU; frames come down in their native format so 10-bit
+            # sources can be converted for NVENC instead of failing as p010 CUDA frames
+            cmd.extend(["-hwaccel", "cuda"])
+        cmd.extend(["-i", input_path])
         
         cmd.extend(["-c:v", codec])
+        if codec == "h264_nvenc":
+            cmd.extend(["-pix_fmt", "yuv420p"])  # h264_nvenc has no 10-bit mode
+        two_pass = False
         
         if self.mode_var.get() == "crf":
-            cmd.extend(["-crf", str(self.crf_var.get())])
+            quality = self.crf_var.get()
+            cmd.extend(nvenc_quality_args(quality) if nvenc else ["-crf", str(quality)])
         else:
             # Target size mode - calculate bitrate
             try:
                 target_mb = float(self.size_entry.get())
-                duration = get_media_duration(input_path)
+                cached_path, duration = self._cached_duration
+                if cached_path != input_path:
+                    duration = get_media_duration(input_path)
                 if duration:
                     # Calculate video bitrate (kbps), reserve ~128k for audio
                     audio_kbps = 128
                     target_kbps = (target_mb * 8 * 1024) / duration
                     video_kbps = max(100, int(target_kbps - audio_kbps))
                     cmd.extend(["-b:v", f"{video_kbps}k"])
+                    # A bitrate target is only hit reliably with a second pass
+                    two_pass = codec == "libx264"
             except:
                 cmd.extend(["-crf", "28"])  # Fallback
         
-        # Only add preset for x264/x265
+        # Only add preset for x264/x265, translated for NVENC
         if codec in ["libx264", "libx265"]:
             cmd.extend(["-preset", preset])
+        elif nvenc:
+            cmd.extend(["-preset", NVENC_PRESETS.get(preset, "p4")])
+        cmd.extend(encoder_thread_args(codec))
+        
+        if pass_num == 1 and not two_pass:
+            return None
+        if two_pass:
+            cmd.extend(["-pass", str(pass_num), "-passlogfile", str(self._passlog)])
+            if pass_num == 1:
+                # Analysis only: no audio, discard the video
+                cmd.extend(["-an", "-f", "null", os.devnull])
+                return cmd
         
         # Audio
         audio = self.audio_var.get()
@@ -229,10 +301,21 @@ class CompressApp(FFmpegToolApp):
         cmd.append(output_path)
         return cmd
     
+    def _show_preview(self, cmd1, cmd2):
+        if cmd1:
+            preview = f"Pass 1: {' '.join(cmd1)}\n\nPass 2: {' '.join(cmd2)}"
+            if self.preview_text:
+                self.preview_text.configure(state="normal")
+                self.preview_text.delete("1.0", tk.END)
+                self.preview_text.insert("1.0", preview)
+                self.preview_text.configure(state="disabled")
+        else:
+            self.set_preview(cmd2)
+    
     def preview_command(self):
         cmd = self.build_command()
         if cmd:
-            self.set_preview(cmd)
+            self._show_preview(self.build_command(pass_num=1), cmd)
         else:
             messagebox.showwarning("Missing Input", "Please select input and output files.")
     
@@ -242,8 +325,47 @@ class CompressApp(FFmpegToolApp):
             messagebox.showwarning("Missing Input", "Please select input and output files.")
             return
         
-        self.set_preview(cmd)
-        self.run_command(cmd, self.input_entry.get())
+        cmd1 = self.build_command(pass_num=1)
+        self._show_preview(cmd1, cmd)
+        if not cmd1:
+            self.run_command(cmd, self.input_entry.get())
+            return
+        
+        # Run pass 1, then pass 2
+        self._pass2_cmd = cmd
+        self._original_callback = self.runner.on_finished
+        self.runner.on_finished = self._on_pass1_finished
+        self.run_command(cmd1, self.input_entry.get())
+        self._on_log("=== Pass 1: Analyzing ===\n")
+    
+    def _on_pass1_finished(self, success, message):
+        self.runner.on_finished = self._original_callback
+        if success:
+            self.root.after(0, self._start_pass2)
+        else:
+            self._remove_passlogs()
+            self._on_finished(False, f"Pass 1 failed: {message}")
+    
+    def _start_pass2(self):
+        # The runner thread is still unwinding from pass 1; let it finish first
+        if self.runner.thread:
+            self.runner.thread.join()
+        self._on_log("\n=== Pass 2: Encoding ===\n")
+        self.runner.on_finished = self._on_pass2_finished
+        self.runner.run(self._pass2_cmd, self.input_entry.get())
+    
+    def _on_pass2_finished(self, success, message):
+        self.runner.on_finished = self._original_callback
+        self._remove_passlogs()
+        self._original_callback(success, message)
+    
+    def _remove_passlogs(self):
+        """Delete the x264 stats files (-0.log, .mbtree and their .temp versions)."""
+        for path in self._passlog.parent.glob(self._passlog.name + "-*"):
+            try:
+                os.remove(path)
+            except:
+                pass
 
 
 if __name__ == "__main__":
@@ -3,26 +3,37 @@ FFmpeg Concat Tool
 Concatenate multiple video files
 """
 
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox
-from pathlib import Path
+from tkinter import ttk, messagebox, filedialog
+import threading
+import functools
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
-    browse_file, browse_save_file, create_card, get_theme, TEMP_DIR
+    FFmpegToolApp, get_binary, get_media_duration, get_media_info, probe_many,
+    format_duration, nvenc_preferred, nvenc_quality_args,
+    browse_file, browse_save_file, create_card, TEMP_DIR
 )
 
+@functools.lru_cache(maxsize=32)
+def _concat_filter(n: int) -> str:
+    """filter_complex for concatenating n inputs with one video and one audio stream each."""
+    inputs = "".join(f"[{i}:v][{i}:a]" for i in range(n))
+    return f"{inputs}concat=n={n}:v=1:a=1[outv][outa]"
+
 class ConcatApp(FFmpegToolApp):
     """Video concatenation tool."""
     
     def __init__(self):
         super().__init__("FFmpeg Concat Videos", width=650, height=600)
         self.video_list = []
+        self._basenames = []  # Listbox labels, parallel to video_list
+        self._total_job = 0
+        self._total_after_id = None
+        self._match_cache = (None, False)  # (sorted clip paths, clips share one stream layout)
         self.build_ui()
     
     def build_ui(self):
-        theme = get_theme()
-        
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill="both", expand=True)
         
@@ -64,11 +75,13 @@ class ConcatApp(FFmpegToolApp):
         method_row.pack(fill="x", pady=5)
         
         ttk.Label(method_row, text="Method:").pack(side="left")
-        self.method_var = tk.StringVar(value="demuxer")
+        self.method_var = tk.StringVar(value="auto")
         method_combo = ttk.Combobox(method_row, textvariable=self.method_var, width=15,
-                                    values=["demuxer", "filter"])
+                                    values=["auto", "demuxer", "filter"])
         method_combo.pack(side="left", padx=5)
         
+        ttk.Label(options_card, text="• auto: demuxer when all clips share codecs and size, else filter",
+                  foreground="gray").pack(anchor="w")
         ttk.Label(options_card, text="• demuxer: Fast, requires same codec (uses concat protocol)",
                   foreground="gray").pack(anchor="w")
         ttk.Label(options_card, text="• filter: Slower, works with different formats",
@@ -79,6 +92,20 @@ class ConcatApp(FFmpegToolApp):
         ttk.Checkbutton(options_card, text="Re-encode output (for filter method)",
                         variable=self.reencode).pack(anchor="w", pady=5)
         
+        # Encoder for re-encoded output
+        codec_row = ttk.Frame(options_card)
+        codec_row.pack(fill="x", pady=5)
+        
+        ttk.Label(codec_row, text="Codec:").pack(side="left")
+        self.codec_var = tk.StringVar(value="h264_nvenc" if nvenc_preferred() else "libx264")
+        ttk.Combobox(codec_row, textvariable=self.codec_var, width=15, state="readonly",
+                     values=["libx264", "h264_nvenc"]).pack(side="left", padx=5)
+        
+        # Encoder speed: "faster" by default, "slow" for best compression
+        self.high_quality = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_card, text="High quality (slower encode)",
+                        variable=self.high_quality).pack(anchor="w")
+        
         # === Output Section ===
         output_card = create_card(main_frame, "📤 Output")
         output_card.pack(fill="x", pady=(0, 10))
@@ -105,13 +132,15 @@ class ConcatApp(FFmpegToolApp):
         bottom.pack(fill="both", expand=True)
     
     def _add_file(self):
-        from tkinter import filedialog
         filetypes = [("Video files", "*.mp4 *.mkv *.avi *.mov *.webm"), ("All files", "*.*")]
         files = filedialog.askopenfilenames(filetypes=filetypes)
-        for f in files:
-            self.video_list.append(f)
-            self.listbox.insert(tk.END, Path(f).name)
-        self._update_total()
+        if files:
+            # One Tcl call for the whole selection
+            names = [os.path.basename(f) for f in files]
+            self.video_list.extend(files)
+            self._basenames.extend(names)
+            self.listbox.insert(tk.END, *names)
+            self._update_total()
     
     def _remove_file(self):
         sel = self.listbox.curselection()
@@ -119,6 +148,7 @@ class ConcatApp(FFmpegToolApp):
             idx = sel[0]
             self.listbox.delete(idx)
             del self.video_list[idx]
+            del self._basenames[idx]
             self._update_total()
     
     def _move_up(self):
@@ -127,10 +157,10 @@ class ConcatApp(FFmpegToolApp):
             idx = sel[0]
             # Swap in list
             self.video_list[idx], self.video_list[idx-1] = self.video_list[idx-1], self.video_list[idx]
+            self._basenames[idx], self._basenames[idx-1] = self._basenames[idx-1], self._basenames[idx]
             # Swap in listbox
-            text = self.listbox.get(idx)
             self.listbox.delete(idx)
-            self.listbox.insert(idx-1, text)
+            self.listbox.insert(idx-1, self._basenames[idx-1])
             self.listbox.selection_set(idx-1)
     
     def _move_down(self):
@@ -139,24 +169,44 @@ class ConcatApp(FFmpegToolApp):
             idx = sel[0]
             # Swap in list
             self.video_list[idx], self.video_list[idx+1] = self.video_list[idx+1], self.video_list[idx]
+            self._basenames[idx], self._basenames[idx+1] = self._basenames[idx+1], self._basenames[idx]
             # Swap in listbox
-            text = self.listbox.get(idx)
             self.listbox.delete(idx)
-            self.listbox.insert(idx+1, text)
+            self.listbox.insert(idx+1, self._basenames[idx+1])
             self.listbox.selection_set(idx+1)
     
     def _clear_list(self):
         self.listbox.delete(0, tk.END)
         self.video_list.clear()
+        self._basenames.clear()
         self._update_total()
     
     def _update_total(self):
-        total_dur = 0
-        for f in self.video_list:
-            dur = get_media_duration(f)
-            if dur:
-                total_dur += dur
-        self.total_label.configure(text=f"Total: {len(self.video_list)} files, {format_duration(total_dur)}")
+        # Coalesce bursts of list edits into one recompute
+        if self._total_after_id:
+            self.root.after_cancel(self._total_after_id)
+        self._total_after_id = self.root.after(30, self._start_total)
+    
+    def _start_total(self):
+        # Probe on a worker thread; only the newest request may update the label
+        self._total_after_id = None
+        self._total_job += 1
+        threading.Thread(target=self._compute_total, args=(self._total_job, list(self.video_list)),
+                         daemon=True).start()
+    
+    def _compute_total(self, job, files):
+        total_dur = sum(d for d in probe_many(files, get_media_duration) if d)
+        # Same cached probes, so deciding the "auto" method here costs no extra ffprobe runs
+        signatures = probe_many(files, self._stream_signature) if files else [None]
+        match = signatures[0] is not None and all(s == signatures[0] for s in signatures)
+        
+        def update():
+            # Keyed by the clip set itself, so even a superseded job's answer stays valid
+            self._match_cache = (tuple(sorted(files)), match)
+            if job == self._total_job:
+                self.total_label.configure(text=f"Total: {len(files)} files, {format_duration(total_dur)}")
+        
+        self.root.after(0, update)
     
     def _browse_output(self):
         filetypes = [("MP4 files", "*.mp4"), ("All files", "*.*")]
@@ -164,14 +214,49 @@ class ConcatApp(FFmpegToolApp):
     
     def _create_concat_file(self):
         """Create concat demuxer file list."""
-        concat_file = TEMP_DIR / "concat_list.txt"
-        with open(concat_file, "w", encoding="utf-8") as f:
-            for video in self.video_list:
-                # Escape single quotes
-                escaped = video.replace("'", "'\\''")
-                f.write(f"file '{escaped}'\n")
+        # Per-process name so concurrent instances don't overwrite each other's list
+        concat_file = TEMP_DIR / f"concat_list_{os.getpid()}.txt"
+        lines = []
+        for video in self.video_list:
+            # Escape single quotes
+            escaped = video.replace("'", "'\\''") if "'" in video else video
+            lines.append(f"file '{escaped}'\n")
+        concat_file.write_text("".join(lines), encoding="utf-8")
         return str(concat_file)
     
+    @staticmethod
+    def _stream_signature(path: str) -> tuple | None:
+        """Codec/size/rate of a clip's first video and audio streams (from the cached probe)."""
+        info = get_media_info(path)
+        if not info:
+            return None
+        video = audio = None
+        for stream in info.get("streams", []):
+            if stream.get("codec_type") == "video" and video is None:
+                video = (stream.get("codec_name"), stream.get("width"), stream.get("height"),
+                         stream.get("r_frame_rate"), stream.get("pix_fmt"))
+            elif stream.get("codec_type") == "audio" and audio is None:
+                audio = (stream.get("codec_name"), stream.get("sample_rate"), stream.get("channels"))
+        return video, audio
+    
+    def _clips_match(self) -> bool:
+        """True when every clip can be joined by the concat demuxer without re-encoding.
+        
+        Read from the probe _compute_total runs when the list changes; until it has
+        answered for the current clips this is False, so "auto" picks the filter,
+        which works for any input.
+        """
+        return self._match_cache[0] == tuple(sorted(self.video_list)) and self._match_cache[1]
+    
+    def _video_encoder_args(self) -> list:
+        """Encoder settings for re-encoded output."""
+        hq = self.high_quality.get()
+        if self.codec_var.get() == "h264_nvenc":
+            # h264_nvenc has no 10-bit mode
+            return ["-c:v", "h264_nvenc", "-preset", "p7" if hq else "p5", *nvenc_quality_args(23),
+                    "-pix_fmt", "yuv420p"]
+        return ["-c:v", "libx264", "-preset", "slow" if hq else "faster", "-crf", "23"]
+    
     def build_command(self) -> list:
         if len(self.video_list) < 2:
             return None
@@ -181,28 +266,30 @@ class ConcatApp(FFmpegToolApp):
             return None
         
         method = self.method_var.get()
+        if method == "auto":
+            # Identical streams can be stream-copied in one pass; mixed inputs need the filter
+            method = "demuxer" if self._clips_match() else "filter"
         
         if method == "demuxer":
             concat_file = self._create_concat_file()
-            cmd = [get_binary("ffmpeg"), "-y", "-f", "concat", "-safe", "0",
-                   "-i", concat_file]
+            cmd = [get_binary("ffmpeg"), "-y"]
+            if self.reencode.get() and self.codec_var.get() == "h264_nvenc":
+                # Frames come down in their native format so 10-bit clips can be converted
+                cmd.extend(["-hwaccel", "cuda"])
+            cmd.extend(["-f", "concat", "-safe", "0", "-i", concat_file])
             if not self.reencode.get():
                 cmd.extend(["-c", "copy"])
             else:
-                cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "aac"])
+                cmd.extend(self._video_encoder_args() + ["-c:a", "aac"])
         else:
             # Filter concat
             cmd = [get_binary("ffmpeg"), "-y"]
             for video in self.video_list:
                 cmd.extend(["-i", video])
             
-            # Build filter complex
-            n = len(self.video_list)
-            inputs = "".join([f"[{i}:v][{i}:a]" for i in range(n)])
-            filter_complex = f"{inputs}concat=n={n}:v=1:a=1[outv][outa]"
-            cmd.extend(["-filter_complex", filter_complex])
-            cmd.extend(["-map", "[outv]", "-map", "[outa]"])
-            cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "aac"])
+            cmd.extend(["-filter_complex", _concat_filter(len(self.video_list)),
+                        "-map", "[outv]", "-map", "[outa]"])
+            cmd.extend(self._video_encoder_args() + ["-c:a", "aac"])
         
         cmd.append(output_path)
         return cmd
@@ -9,15 +9,44 @@ from pathlib import Path
 
 # Import shared utilities
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
+    FFmpegToolApp, get_binary, get_media_duration, get_media_info, format_duration, nvenc_preferred,
+    probe_async, estimate_encode_time, nvenc_quality_args, encoder_thread_args,
     generate_output_path, browse_file, browse_save_file, create_card, get_theme
 )
 
+# Codecs each container can carry as-is: (video, audio); None accepts anything
+CONTAINER_COMPAT = {
+    "mp4": ({"h264", "hevc", "av1", "mpeg4", "vp9"}, {"aac", "mp3", "ac3", "eac3", "opus", "flac", "alac"}),
+    "mkv": (None, None),
+    "mov": ({"h264", "hevc", "prores", "mjpeg", "mpeg4"}, {"aac", "mp3", "alac", "pcm_s16le", "pcm_s24le"}),
+    "webm": ({"vp8", "vp9", "av1"}, {"opus", "vorbis"}),
+    "avi": ({"mpeg4", "h264", "mjpeg", "msmpeg4v3"}, {"mp3", "ac3", "pcm_s16le"}),
+    "flv": ({"h264", "flv1"}, {"aac", "mp3"}),
+    "ts": ({"h264", "hevc", "mpeg2video"}, {"aac", "mp3", "ac3", "mp2"}),
+}
+
+# Per-codec video options for a quality value; codecs not listed take ffmpeg's defaults
+QUALITY_ARGS = {
+    "libx264": lambda q: ["-crf", q],
+    "libx265": lambda q: ["-crf", q],
+    "libvpx-vp9": lambda q: ["-crf", q, "-b:v", "0"],
+    "h264_nvenc": lambda q: ["-preset", "p5", *nvenc_quality_args(q)],
+    "hevc_nvenc": lambda q: ["-preset", "p5", *nvenc_quality_args(q)],
+    "h264_qsv": lambda q: ["-global_quality", q],
+    "hevc_qsv": lambda q: ["-global_quality", q],
+}
+
 class ConvertApp(FFmpegToolApp):
     """Video format conversion tool."""
     
     def __init__(self):
         super().__init__("FFmpeg Convert", width=650, height=600)
+        # (video, audio) codec names of the current input
+        self._source_codecs = (None, None)
+        self._auto_copy = False
+        self._duration = None
+        self._cmd_cache_key = None
+        self._cmd_cache = None
         self.build_ui()
     
     def build_ui(self):
@@ -72,23 +101,32 @@ class ConvertApp(FFmpegToolApp):
         format_combo.pack(side="left", padx=5)
         format_combo.bind("<<ComboboxSelected>>", self._on_format_changed)
         
+        self.copy_label = ttk.Label(format_row, text="", foreground=theme["success"])
+        self.copy_label.pack(side="left", padx=10)
+        
         # Video codec
         vcodec_row = ttk.Frame(options_card)
         vcodec_row.pack(fill="x", pady=2)
         
         ttk.Label(vcodec_row, text="Video Codec:").pack(side="left")
-        self.vcodec_var = tk.StringVar(value="libx264")
+        # (video, audio) codecs the form starts with; only these are swapped for stream copy
+        self._default_codecs = ("h264_nvenc" if nvenc_preferred() else "libx264", "aac")
+        self.vcodec_var = tk.StringVar(value=self._default_codecs[0])
         vcodec_combo = ttk.Combobox(vcodec_row, textvariable=self.vcodec_var, width=15,
                                     values=["copy", "libx264", "libx265", "libvpx-vp9", 
                                             "h264_nvenc", "hevc_nvenc", "h264_qsv", "hevc_qsv"])
         vcodec_combo.pack(side="left", padx=5)
         
+        self.estimate_label = ttk.Label(vcodec_row, text="", foreground="gray")
+        self.estimate_label.pack(side="left", padx=10)
+        self.vcodec_var.trace_add("write", lambda *_: self._update_estimate())
+        
         # Audio codec
         acodec_row = ttk.Frame(options_card)
         acodec_row.pack(fill="x", pady=2)
         
         ttk.Label(acodec_row, text="Audio Codec:").pack(side="left")
-        self.acodec_var = tk.StringVar(value="aac")
+        self.acodec_var = tk.StringVar(value=self._default_codecs[1])
         acodec_combo = ttk.Combobox(acodec_row, textvariable=self.acodec_var, width=15,
                                     values=["copy", "aac", "mp3", "opus", "flac", "ac3"])
         acodec_combo.pack(side="left", padx=5)
@@ -132,9 +170,11 @@ class ConvertApp(FFmpegToolApp):
         # Update duration and auto-generate output
         input_path = self.input_entry.get()
         if input_path:
-            duration = get_media_duration(input_path)
-            if duration:
-                self.duration_label.configure(text=f"Duration: {format_duration(duration)}")
+            # Probe off the Tk thread so slow (e.g. network) files don't freeze the window
+            self._source_codecs = (None, None)
+            future = probe_async(input_path, get_media_duration)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._on_probed, input_path, f.result()))
             
             # Auto-generate output path
             ext = "." + self.format_var.get()
@@ -142,6 +182,18 @@ class ConvertApp(FFmpegToolApp):
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, output_path)
     
+    def _on_probed(self, input_path, duration):
+        if input_path != self.input_entry.get():
+            return  # A different file was picked meanwhile
+        self._duration = duration
+        self._update_estimate()
+        if duration:
+            self.duration_label.configure(text=f"Duration: {format_duration(duration)}")
+        
+        # Served from the probe cache the duration lookup just filled
+        self._source_codecs = self._probe_codecs(input_path)
+        self._update_stream_copy()
+    
     def _browse_output(self):
         ext = self.format_var.get()
         filetypes = [(f"{ext.upper()} files", f"*.{ext}"), ("All files", "*.*")]
@@ -155,26 +207,91 @@ class ConvertApp(FFmpegToolApp):
             output_path = generate_output_path(input_path, "_converted", ext)
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, output_path)
+            self._update_stream_copy()
+    
+    def _update_estimate(self):
+        """Show a ballpark encode time for the selected video codec."""
+        runtime = estimate_encode_time(self.vcodec_var.get(), "medium", self._duration)
+        self.estimate_label.configure(text=f"Estimated: ~{format_duration(runtime)}" if runtime else "")
+    
+    def _probe_codecs(self, input_path: str) -> tuple:
+        """Return the first video and audio codec names (None when absent)."""
+        info = get_media_info(input_path) or {}
+        video = audio = None
+        for stream in info.get("streams", []):
+            if stream.get("codec_type") == "video" and video is None:
+                video = stream.get("codec_name")
+            elif stream.get("codec_type") == "audio" and audio is None:
+                audio = stream.get("codec_name")
+        return video, audio
+    
+    def _update_stream_copy(self):
+        """Prefer stream copy when the target container can hold the source codecs.
+        
+        Codecs are only switched while they are still the defaults (or our own
+        earlier switch); a manual choice is kept and the label just suggests copy.
+        """
+        video, audio = self._source_codecs
+        vset, aset = CONTAINER_COMPAT.get(self.format_var.get(), (set(), set()))
+        compatible = (video or audio) and \
+            (video is None or vset is None or video in vset) and \
+            (audio is None or aset is None or audio in aset)
+        current = (self.vcodec_var.get(), self.acodec_var.get())
+        auto_copied = self._auto_copy and current == ("copy", "copy")
+        
+        if compatible and (auto_copied or current == self._default_codecs):
+            self.vcodec_var.set("copy")
+            self.acodec_var.set("copy")
+            self.copy_label.configure(text="Stream copy (no re-encode)")
+            self._auto_copy = True
+            return
+        
+        if auto_copied:
+            # Undo our own switch, but leave a manual "copy" choice alone
+            self.vcodec_var.set(self._default_codecs[0])
+            self.acodec_var.set(self._default_codecs[1])
+        self._auto_copy = False
+        if compatible and current != ("copy", "copy"):
+            self.copy_label.configure(text="Stream copy possible (set both codecs to copy)")
+        else:
+            self.copy_label.configure(text="")
     
     def build_command(self) -> list:
-        """Build FFmpeg command."""
+        """Build FFmpeg command, reusing the last one while no option has changed."""
+        key = (self.input_entry.get(), self.output_entry.get(), self.vcodec_var.get(),
+               self.acodec_var.get(), self.crf_var.get())
+        if key != self._cmd_cache_key:
+            self._cmd_cache = self._build_command()
+            self._cmd_cache_key = key
+        return self._cmd_cache
+    
+    def _build_command(self) -> list:
         input_path = self.input_entry.get()
         output_path = self.output_entry.get()
         
         if not input_path or not output_path:
             return None
         
-        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
+        vcodec = self.vcodec_var.get()
+        
+        cmd = [get_binary("ffmpeg"), "-y"]
+        if vcodec.endswith("_nvenc"):
+            # Decode on the GPU; frames come down in their native format so 10-bit
+            # sources can be converted for NVENC instead of failing as p010 CUDA frames
+            cmd.extend(["-hwaccel", "cuda"])
+        cmd.extend(["-i", input_path])
         
         # Video codec
-        vcodec = self.vcodec_var.get()
         if vcodec == "copy":
             cmd.extend(["-c:v", "copy"])
         else:
             cmd.extend(["-c:v", vcodec])
-            # Add CRF for x264/x265
-            if vcodec in ["libx264", "libx265"]:
-                cmd.extend(["-crf", str(self.crf_var.get())])
+            if vcodec == "h264_nvenc":
+                cmd.extend(["-pix_fmt", "yuv420p"])  # h264_nvenc has no 10-bit mode
+            quality_args = QUALITY_ARGS.get(vcodec)
+            if quality_args:
+                cmd.extend(quality_args(str(self.crf_var.get())))
+            cmd.extend(encoder_thread_args(vcodec))
         
         # Audio codec
         acodec = self.acodec_var.get()
@@ -3,27 +3,52 @@ FFmpeg Crop Tool
 Crop video to specific region
 """
 
+import os
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
+from functools import partial
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, get_media_info, format_duration,
-    generate_output_path, browse_file, browse_save_file, create_card, get_theme
+    FFmpegToolApp, get_binary, probe_async, format_duration,
+    generate_output_path, browse_file, browse_files, browse_save_file, create_card,
+    create_entry_row,
+    has_nvenc, nvenc_quality_args, NVENC_PRESETS
 )
 
+# Crop sizes and offsets are plain (possibly negative) integers
+_INT_RE = re.compile(r"^-?\d+$")
+
+# Output options that follow the video encoder settings on every command
+_OUTPUT_ARGS = ("-pix_fmt", "yuv420p", "-movflags", "+faststart", "-c:a", "copy")
+
 class CropApp(FFmpegToolApp):
     """Video cropping tool."""
     
+    # Preset value -> (width, height) aspect ratio
+    _ASPECTS = {"16:9": (16, 9), "4:3": (4, 3), "1:1": (1, 1), "9:16": (9, 16)}
+    
+    # (button text, preset value)
+    PRESETS = (
+        ("Center", "center"),
+        ("16:9", "16:9"),
+        ("4:3", "4:3"),
+        ("1:1 (Square)", "1:1"),
+        ("9:16 (Vertical)", "9:16"),
+    )
+    
     def __init__(self):
-        super().__init__("FFmpeg Crop", width=600, height=580)
+        super().__init__("FFmpeg Crop", width=600, height=620)
         self.input_width = 0
         self.input_height = 0
+        self._dims_path = None  # Input whose width/height have been probed
+        self.batch_files = []  # Extra inputs picked with "Batch…", cropped in parallel
+        self._aspect_crop = None  # (a, b, width, height) last filled in by an aspect preset
+        self._last_auto_output = None  # Output path we filled in, as opposed to one the user typed
         self.build_ui()
     
     def build_ui(self):
-        theme = get_theme()
-        
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill="both", expand=True)
         
@@ -38,6 +63,7 @@ class CropApp(FFmpegToolApp):
         self.input_entry = ttk.Entry(input_row, width=50)
         self.input_entry.pack(side="left", padx=5, fill="x", expand=True)
         ttk.Button(input_row, text="Browse", command=self._browse_input).pack(side="left")
+        ttk.Button(input_row, text="Batch…", command=self._browse_batch).pack(side="left", padx=(5, 0))
         
         self.info_label = ttk.Label(input_card, text="Resolution: -- | Duration: --:--:--")
         self.info_label.pack(anchor="w", pady=(5, 0))
@@ -47,48 +73,21 @@ class CropApp(FFmpegToolApp):
         crop_card.pack(fill="x", pady=(0, 10))
         
         # Output dimensions
-        dim_row = ttk.Frame(crop_card)
-        dim_row.pack(fill="x", pady=5)
-        
-        ttk.Label(dim_row, text="Output Width:").pack(side="left")
-        self.width_entry = ttk.Entry(dim_row, width=8)
-        self.width_entry.insert(0, "1280")
-        self.width_entry.pack(side="left", padx=5)
-        
-        ttk.Label(dim_row, text="Height:").pack(side="left", padx=(20, 0))
-        self.height_entry = ttk.Entry(dim_row, width=8)
-        self.height_entry.insert(0, "720")
-        self.height_entry.pack(side="left", padx=5)
+        self.width_entry, self.height_entry = create_entry_row(
+            crop_card, (("Output Width:", "1280"), ("Height:", "720")))
         
         # Position
-        pos_row = ttk.Frame(crop_card)
-        pos_row.pack(fill="x", pady=5)
-        
-        ttk.Label(pos_row, text="X offset:").pack(side="left")
-        self.x_entry = ttk.Entry(pos_row, width=8)
-        self.x_entry.insert(0, "0")
-        self.x_entry.pack(side="left", padx=5)
-        
-        ttk.Label(pos_row, text="Y offset:").pack(side="left", padx=(20, 0))
-        self.y_entry = ttk.Entry(pos_row, width=8)
-        self.y_entry.insert(0, "0")
-        self.y_entry.pack(side="left", padx=5)
+        self.x_entry, self.y_entry = create_entry_row(
+            crop_card, (("X offset:", "0"), ("Y offset:", "0")))
         
         # Preset buttons
         preset_row = ttk.Frame(crop_card)
         preset_row.pack(fill="x", pady=5)
         
         ttk.Label(preset_row, text="Presets:").pack(side="left")
-        presets = [
-            ("Center", "center"),
-            ("16:9", "16:9"),
-            ("4:3", "4:3"),
-            ("1:1 (Square)", "1:1"),
-            ("9:16 (Vertical)", "9:16")
-        ]
-        for name, value in presets:
+        for name, value in self.PRESETS:
             btn = ttk.Button(preset_row, text=name, width=10,
-                           command=lambda v=value: self._apply_preset(v))
+                           command=partial(self._apply_preset, value))
             btn.pack(side="left", padx=2)
         
         # Center crop option
@@ -108,6 +107,19 @@ class CropApp(FFmpegToolApp):
         self.output_entry.pack(side="left", padx=5, fill="x", expand=True)
         ttk.Button(output_row, text="Browse", command=self._browse_output).pack(side="left")
         
+        encode_row = ttk.Frame(output_card)
+        encode_row.pack(fill="x", pady=(5, 0))
+        
+        ttk.Label(encode_row, text="Speed:").pack(side="left")
+        self.preset_var = tk.StringVar(value="veryfast")
+        ttk.Combobox(encode_row, textvariable=self.preset_var, width=10, state="readonly",
+                     values=["veryfast", "medium", "slow"]).pack(side="left", padx=5)
+        
+        # Only takes effect when the ffmpeg build has NVENC
+        self.hw_encode = tk.BooleanVar(value=False)
+        ttk.Checkbutton(encode_row, text="Hardware encode (NVENC)",
+                        variable=self.hw_encode).pack(side="left", padx=(15, 0))
+        
         # === Action Buttons ===
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill="x", pady=10)
@@ -127,119 +139,174 @@ class CropApp(FFmpegToolApp):
         
         input_path = self.input_entry.get()
         if input_path:
-            duration = get_media_duration(input_path)
-            info = get_media_info(input_path)
-            
-            dur_str = format_duration(duration) if duration else "--:--:--"
-            res_str = "--"
+            self.batch_files = []
+            # Dimensions are only needed by the aspect presets, which probe on demand
+            self.input_width = self.input_height = 0
+            self._dims_path = None
+            self.info_label.configure(text="Resolution: -- | Duration: --:--:--")
             
-            if info and "streams" in info:
-                for stream in info["streams"]:
-                    if stream.get("codec_type") == "video":
-                        self.input_width = stream.get("width", 0)
-                        self.input_height = stream.get("height", 0)
-                        res_str = f"{self.input_width}x{self.input_height}"
-                        break
-            
-            self.info_label.configure(text=f"Resolution: {res_str} | Duration: {dur_str}")
-            
-            output_path = generate_output_path(input_path, "_cropped")
-            self.output_entry.delete(0, tk.END)
-            self.output_entry.insert(0, output_path)
+            self._suggest_output(input_path)
+    
+    def _suggest_output(self, input_path):
+        """Fill in an output path unless the user has typed their own."""
+        current = self.output_entry.get()
+        if not current or current == self._last_auto_output:
+            self._last_auto_output = generate_output_path(input_path, "_cropped")
+            self._set_entry(self.output_entry, self._last_auto_output)
+    
+    def _browse_batch(self):
+        filetypes = [("Video files", "*.mp4 *.mkv *.avi *.mov *.webm"), ("All files", "*.*")]
+        files = browse_files(filetypes)
+        if not files:
+            return
+        
+        self.batch_files = files
+        self._set_entry(self.input_entry, files[0])
+        self._suggest_output(files[0])
+        self.input_width = self.input_height = 0
+        self._dims_path = None
+        self.info_label.configure(text=f"Batch: {len(files)} files (outputs saved next to each input)")
+    
+    def _ensure_dims(self, then):
+        """Probe the input's size off the Tk thread, then call `then` on the Tk thread."""
+        input_path = self.input_entry.get()
+        if not input_path:
+            messagebox.showinfo("Info", "Please load a video first.")
+            return
+        self.info_label.configure(text="Probing…")
+        future = probe_async(input_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_probe_result, input_path, f.result(), then))
+    
+    def _apply_probe_result(self, input_path, fields, then=None):
+        if input_path != self.input_entry.get():
+            return  # Superseded by a later browse
+        self._dims_path = input_path
+        duration = fields.duration if fields else None
+        
+        dur_str = format_duration(duration) if duration else "--:--:--"
+        res_str = "--"
+        
+        if fields and fields.width:
+            self.input_width = fields.width
+            self.input_height = fields.height or 0
+            res_str = f"{self.input_width}x{self.input_height}"
+        
+        self.info_label.configure(text=f"Resolution: {res_str} | Duration: {dur_str}")
+        if then:
+            then()
     
     def _browse_output(self):
         filetypes = [("MP4 files", "*.mp4"), ("All files", "*.*")]
         browse_save_file(self.output_entry, filetypes, ".mp4")
     
     def _apply_preset(self, preset):
+        aspect = self._ASPECTS.get(preset)
+        if aspect is None:
+            # "center": keep the current size, just center
+            return
+        
+        if self._dims_path != self.input_entry.get():
+            self._ensure_dims(lambda: self._apply_preset(preset))
+            return
         if not self.input_width or not self.input_height:
-            messagebox.showinfo("Info", "Please load a video first.")
+            messagebox.showinfo("Info", "Could not read the video resolution.")
             return
         
-        if preset == "center":
-            # Keep current size, just center
-            pass
-        elif preset == "16:9":
-            if self.input_width / self.input_height > 16/9:
-                # Video is wider
-                new_h = self.input_height
-                new_w = int(new_h * 16 / 9)
-            else:
-                new_w = self.input_width
-                new_h = int(new_w * 9 / 16)
-            self.width_entry.delete(0, tk.END)
-            self.width_entry.insert(0, str(new_w))
-            self.height_entry.delete(0, tk.END)
-            self.height_entry.insert(0, str(new_h))
-        elif preset == "4:3":
-            if self.input_width / self.input_height > 4/3:
-                new_h = self.input_height
-                new_w = int(new_h * 4 / 3)
-            else:
-                new_w = self.input_width
-                new_h = int(new_w * 3 / 4)
-            self.width_entry.delete(0, tk.END)
-            self.width_entry.insert(0, str(new_w))
-            self.height_entry.delete(0, tk.END)
-            self.height_entry.insert(0, str(new_h))
-        elif preset == "1:1":
-            size = min(self.input_width, self.input_height)
-            self.width_entry.delete(0, tk.END)
-            self.width_entry.insert(0, str(size))
-            self.height_entry.delete(0, tk.END)
-            self.height_entry.insert(0, str(size))
-        elif preset == "9:16":
-            if self.input_height / self.input_width > 16/9:
-                new_w = self.input_width
-                new_h = int(new_w * 16 / 9)
-            else:
-                new_h = self.input_height
-                new_w = int(new_h * 9 / 16)
-            self.width_entry.delete(0, tk.END)
-            self.width_entry.insert(0, str(new_w))
-            self.height_entry.delete(0, tk.END)
-            self.height_entry.insert(0, str(new_h))
-    
-    def build_command(self) -> list:
-        input_path = self.input_entry.get()
-        output_path = self.output_entry.get()
+        # Largest a:b box that fits the frame, in integer math
+        a, b = aspect
+        iw, ih = self.input_width, self.input_height
+        if iw * b > ih * a:
+            new_w, new_h = ih * a // b, ih
+        else:
+            new_w, new_h = iw, iw * b // a
+        self._set_entry(self.width_entry, new_w)
+        self._set_entry(self.height_entry, new_h)
+        self._aspect_crop = (a, b, str(new_w), str(new_h))
+    
+    def _active_batch(self):
+        """Batch inputs, dropped once the Input entry no longer shows the batch's first file."""
+        if self.batch_files and self.input_entry.get() != self.batch_files[0]:
+            self.batch_files = []
+        return self.batch_files
+    
+    @staticmethod
+    def _set_entry(entry, value):
+        entry.delete(0, tk.END)
+        entry.insert(0, str(value))
+    
+    def build_command(self, input_path=None, output_path=None) -> list:
+        """Crop command for the entered settings; input_path/output_path override the entries for batch jobs."""
+        batch = input_path is not None
+        input_path = input_path or self.input_entry.get()
+        output_path = output_path or self.output_entry.get()
         
         if not input_path or not output_path:
             return None
         
         w = self.width_entry.get().strip()
         h = self.height_entry.get().strip()
+        if not (_INT_RE.match(w) and _INT_RE.match(h)):
+            return None
+        
+        if batch and self._aspect_crop and self._aspect_crop[2:] == (w, h):
+            # The preset size was worked out for the first file; let ffmpeg fit the
+            # same aspect ratio to each input instead
+            a, b = self._aspect_crop[:2]
+            w = f"'min(iw,ih*{a}/{b})'"
+            h = f"'min(ih,iw*{b}/{a})'"
         
-        if self.center_crop.get() and self.input_width and self.input_height:
-            x = f"(in_w-{w})/2"
-            y = f"(in_h-{h})/2"
+        # ffmpeg resolves in_w/in_h itself, so centering needs no probe
+        if self.center_crop.get():
+            x = "(in_w-out_w)/2"
+            y = "(in_h-out_h)/2"
         else:
             x = self.x_entry.get().strip()
             y = self.y_entry.get().strip()
+            if not (_INT_RE.match(x) and _INT_RE.match(y)):
+                return None
         
-        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
-        
-        crop_filter = f"crop={w}:{h}:{x}:{y}"
-        cmd.extend(["-vf", crop_filter])
-        cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "copy"])
-        cmd.append(output_path)
+        preset = self.preset_var.get()
+        if self.hw_encode.get() and has_nvenc():
+            video = ("-c:v", "h264_nvenc", "-preset", NVENC_PRESETS.get(preset, "p4"), *nvenc_quality_args(23))
+        else:
+            video = ("-c:v", "libx264", "-preset", preset, "-crf", "23")
         
-        return cmd
+        return [get_binary("ffmpeg"), "-y", "-i", input_path, "-vf", f"crop={w}:{h}:{x}:{y}",
+                *video, *_OUTPUT_ARGS, output_path]
+    
+    def _warn_invalid(self):
+        """Explain why build_command returned None."""
+        if not self.input_entry.get() or not self.output_entry.get():
+            messagebox.showwarning("Missing Input", "Please select input and output files.")
+        else:
+            messagebox.showwarning("Invalid Region", "Width, height and position must be whole numbers.")
     
     def preview_command(self):
         cmd = self.build_command()
         if cmd:
             self.set_preview(cmd)
         else:
-            messagebox.showwarning("Missing Input", "Please select input and output files.")
+            self._warn_invalid()
     
     def run_crop(self):
         cmd = self.build_command()
         if not cmd:
-            messagebox.showwarning("Missing Input", "Please select input and output files.")
+            self._warn_invalid()
             return
         
         self.set_preview(cmd)
+        
+        if len(self._active_batch()) > 1:
+            jobs = []
+            for path in self.batch_files:
+                job = self.build_command(path, generate_output_path(path, "_cropped"))
+                # Several encodes share the CPU; cap each one's threads
+                job[-1:-1] = ["-threads", "2"]
+                jobs.append((os.path.basename(path), job))
+            self.run_parallel(jobs)
+            return
+        
         self.run_command(cmd, self.input_entry.get())
 
 
@@ -6,24 +6,50 @@ Remove logos/watermarks from video
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
+from functools import partial
 import os
+import io
+import re
+import math
 import subprocess
+import threading
+from collections import OrderedDict
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
-    generate_output_path, browse_file, browse_save_file, create_card, get_theme, TEMP_DIR
+    FFmpegToolApp, get_binary, probe_async, format_duration,
+    generate_output_path, browse_file, browse_files, browse_save_file, create_card, SPAWN_KWARGS,
+    create_entry_row, has_cuda, has_nvenc, ffplay_has_option, NVENC_PRESETS, nvenc_quality_args,
+    get_media_duration, segment_jobs
 )
 
+# A pixel count, or an offset from the right/bottom edge such as "iw-110"
+_EXPR_RE = re.compile(r"^(?:-?\d+|i[wh][+-]?\d*)$")
+_INT_RE = re.compile(r"^\d+$")  # Crop sizes
+
+# Output options that follow the video encoder settings on every command
+_OUTPUT_ARGS = ("-movflags", "+faststart", "-c:a", "copy")
+
 class DelogoApp(FFmpegToolApp):
     """Logo/watermark removal tool."""
     
+    # (button text, x, y) exactly as they go into the entries
+    PRESETS = (
+        ("Top-Left", "10", "10"),
+        ("Top-Right", "iw-110", "10"),
+        ("Bottom-Left", "10", "ih-60"),
+        ("Bottom-Right", "iw-110", "ih-60"),
+    )
+    
     def __init__(self):
-        super().__init__("FFmpeg Delogo", width=600, height=560)
+        super().__init__("FFmpeg Delogo", width=600, height=620)
+        self.batch_files = []  # Extra inputs picked with "Batch…", processed in parallel
+        self._last_auto_output = None  # Output path we filled in, as opposed to one the user typed
+        self._frame_size = None  # (width, height) of _probed_path
+        self._duration = None  # Duration of _probed_path in seconds
+        self._probed_path = None  # Input the probe results above belong to
         self.build_ui()
     
     def build_ui(self):
-        theme = get_theme()
-        
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill="both", expand=True)
         
@@ -38,6 +64,7 @@ class DelogoApp(FFmpegToolApp):
         self.input_entry = ttk.Entry(input_row, width=50)
         self.input_entry.pack(side="left", padx=5, fill="x", expand=True)
         ttk.Button(input_row, text="Browse", command=self._browse_input).pack(side="left")
+        ttk.Button(input_row, text="Batch…", command=self._browse_batch).pack(side="left", padx=(5, 0))
         
         self.duration_label = ttk.Label(input_card, text="Duration: --:--:--")
         self.duration_label.pack(anchor="w", pady=(5, 0))
@@ -52,47 +79,19 @@ class DelogoApp(FFmpegToolApp):
         ttk.Button(tools_row, text="Select Area via Visual Selector", command=self._open_selector).pack(side="left")
         
         # Position
-        pos_row = ttk.Frame(region_card)
-        pos_row.pack(fill="x", pady=5)
-        
-        ttk.Label(pos_row, text="X:").pack(side="left")
-        self.x_entry = ttk.Entry(pos_row, width=8)
-        self.x_entry.insert(0, "10")
-        self.x_entry.pack(side="left", padx=5)
-        
-        ttk.Label(pos_row, text="Y:").pack(side="left", padx=(20, 0))
-        self.y_entry = ttk.Entry(pos_row, width=8)
-        self.y_entry.insert(0, "10")
-        self.y_entry.pack(side="left", padx=5)
+        self.x_entry, self.y_entry = create_entry_row(region_card, (("X:", "10"), ("Y:", "10")))
         
         # Size
-        size_row = ttk.Frame(region_card)
-        size_row.pack(fill="x", pady=5)
-        
-        ttk.Label(size_row, text="Width:").pack(side="left")
-        self.w_entry = ttk.Entry(size_row, width=8)
-        self.w_entry.insert(0, "100")
-        self.w_entry.pack(side="left", padx=5)
-        
-        ttk.Label(size_row, text="Height:").pack(side="left", padx=(20, 0))
-        self.h_entry = ttk.Entry(size_row, width=8)
-        self.h_entry.insert(0, "50")
-        self.h_entry.pack(side="left", padx=5)
+        self.w_entry, self.h_entry = create_entry_row(region_card, (("Width:", "100"), ("Height:", "50")))
         
         # Presets for common positions
         preset_row = ttk.Frame(region_card)
         preset_row.pack(fill="x", pady=5)
         
         ttk.Label(preset_row, text="Presets:").pack(side="left")
-        presets = [
-            ("Top-Left", 10, 10),
-            ("Top-Right", -110, 10),
-            ("Bottom-Left", 10, -60),
-            ("Bottom-Right", -110, -60)
-        ]
-        for name, x, y in presets:
+        for name, x, y in self.PRESETS:
             btn = ttk.Button(preset_row, text=name, width=10,
-                           command=lambda px=x, py=y: self._set_preset(px, py))
+                           command=partial(self._set_preset, x, y))
             btn.pack(side="left", padx=2)
         
         ttk.Label(region_card, text="💡 Tip: Use ffplay to find exact coordinates",
@@ -106,6 +105,38 @@ class DelogoApp(FFmpegToolApp):
         ttk.Checkbutton(options_card, text="Show region outline (for testing)",
                         variable=self.show_region).pack(anchor="w")
         
+        speed_row = ttk.Frame(options_card)
+        speed_row.pack(fill="x", pady=(5, 0))
+        ttk.Label(speed_row, text="Speed:").pack(side="left")
+        self.preset_var = tk.StringVar(value="veryfast")
+        ttk.Combobox(speed_row, textvariable=self.preset_var, width=10, state="readonly",
+                     values=["veryfast", "medium", "slow"]).pack(side="left", padx=5)
+        
+        # Only takes effect when the ffmpeg build has both CUDA decoding and NVENC
+        self.use_gpu = tk.BooleanVar(value=False)
+        ttk.Checkbutton(speed_row, text="Use GPU (CUDA + NVENC)",
+                        variable=self.use_gpu).pack(side="left", padx=(15, 0))
+        
+        # Long videos can be encoded as N time ranges at once and joined losslessly
+        ttk.Label(speed_row, text="Segments:").pack(side="left", padx=(15, 0))
+        self.parallel_segments = tk.IntVar(value=1)
+        ttk.Combobox(speed_row, textvariable=self.parallel_segments, width=3, state="readonly",
+                     values=[1, 2, 4, 8]).pack(side="left", padx=5)
+        
+        # Cropping in the same pass saves a second decode/encode through the Crop tool
+        crop_row = ttk.Frame(options_card)
+        crop_row.pack(fill="x", pady=(5, 0))
+        self.crop_after = tk.BooleanVar(value=False)
+        ttk.Checkbutton(crop_row, text="Also center-crop to",
+                        variable=self.crop_after).pack(side="left")
+        self.crop_w_entry = ttk.Entry(crop_row, width=6)
+        self.crop_w_entry.insert(0, "1280")
+        self.crop_w_entry.pack(side="left", padx=5)
+        ttk.Label(crop_row, text="x").pack(side="left")
+        self.crop_h_entry = ttk.Entry(crop_row, width=6)
+        self.crop_h_entry.insert(0, "720")
+        self.crop_h_entry.pack(side="left", padx=5)
+        
         # === Output Section ===
         output_card = create_card(main_frame, "📤 Output")
         output_card.pack(fill="x", pady=(0, 10))
@@ -138,13 +169,48 @@ class DelogoApp(FFmpegToolApp):
         
         input_path = self.input_entry.get()
         if input_path:
-            duration = get_media_duration(input_path)
-            if duration:
-                self.duration_label.configure(text=f"Duration: {format_duration(duration)}")
+            self.batch_files = []
+            # Probe off the Tk thread; the label fills in when ffprobe returns
+            self.duration_label.configure(text="Duration: probing…")
+            future = probe_async(input_path)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._apply_probe_result, input_path, f.result()))
             
-            output_path = generate_output_path(input_path, "_delogo")
-            self.output_entry.delete(0, tk.END)
-            self.output_entry.insert(0, output_path)
+            self._suggest_output(input_path)
+    
+    def _suggest_output(self, input_path):
+        """Fill in an output path unless the user has typed their own."""
+        current = self.output_entry.get()
+        if not current or current == self._last_auto_output:
+            self._last_auto_output = generate_output_path(input_path, "_delogo")
+            self._set_entry(self.output_entry, self._last_auto_output)
+    
+    def _browse_batch(self):
+        filetypes = [("Video files", "*.mp4 *.mkv *.avi *.mov *.webm"), ("All files", "*.*")]
+        files = browse_files(filetypes)
+        if not files:
+            return
+        
+        self.batch_files = files
+        self._set_entry(self.input_entry, files[0])
+        self._suggest_output(files[0])
+        self.duration_label.configure(text=f"Batch: {len(files)} files (outputs saved next to each input)")
+    
+    def _active_batch(self):
+        """Batch inputs, dropped once the Input entry no longer shows the batch's first file."""
+        if self.batch_files and self.input_entry.get() != self.batch_files[0]:
+            self.batch_files = []
+        return self.batch_files
+    
+    def _apply_probe_result(self, input_path, fields):
+        if input_path != self.input_entry.get():
+            return  # Superseded by a later browse
+        duration = fields.duration if fields else None
+        dur_str = format_duration(duration) if duration else "--:--:--"
+        self.duration_label.configure(text=f"Duration: {dur_str}")
+        self._probed_path = input_path
+        self._duration = duration
+        self._frame_size = (fields.width, fields.height) if fields and fields.width and fields.height else None
     
     def _browse_output(self):
         filetypes = [("MP4 files", "*.mp4"), ("All files", "*.*")]
@@ -162,20 +228,19 @@ class DelogoApp(FFmpegToolApp):
         
         if dialog.result:
             x, y, w, h = dialog.result
-            self.x_entry.delete(0, tk.END)
-            self.x_entry.insert(0, str(x))
-            self.y_entry.delete(0, tk.END)
-            self.y_entry.insert(0, str(y))
-            self.w_entry.delete(0, tk.END)
-            self.w_entry.insert(0, str(w))
-            self.h_entry.delete(0, tk.END)
-            self.h_entry.insert(0, str(h))
+            self._set_entry(self.x_entry, x)
+            self._set_entry(self.y_entry, y)
+            self._set_entry(self.w_entry, w)
+            self._set_entry(self.h_entry, h)
 
     def _set_preset(self, x, y):
-        self.x_entry.delete(0, tk.END)
-        self.x_entry.insert(0, str(x) if x >= 0 else f"iw{x}")
-        self.y_entry.delete(0, tk.END)
-        self.y_entry.insert(0, str(y) if y >= 0 else f"ih{y}")
+        self._set_entry(self.x_entry, x)
+        self._set_entry(self.y_entry, y)
+    
+    @staticmethod
+    def _set_entry(entry, value):
+        entry.delete(0, tk.END)
+        entry.insert(0, str(value))
 
     def run_live_preview(self):
         """Run ffplay with current settings."""
@@ -183,63 +248,151 @@ class DelogoApp(FFmpegToolApp):
         if not input_path:
             return
             
-        x = self.x_entry.get().strip()
-        y = self.y_entry.get().strip()
-        w = self.w_entry.get().strip()
-        h = self.h_entry.get().strip()
+        vf = self._region_filter(input_path)
+        if not vf:
+            messagebox.showwarning("Invalid Region", "X, Y, W and H must be numbers (or iw-N / ih-N), "
+                                   "and the crop size whole numbers.")
+            return
         
-        if self.show_region.get():
-             vf = f"drawbox=x={x}:y={y}:w={w}:h={h}:c=red:t=2"
-        else:
-             vf = f"delogo=x={x}:y={y}:w={w}:h={h}"
-             
-        # ffplay command
-        cmd = [get_binary("ffplay"), "-window_title", "Delogo Preview", 
+        # ffplay command; "Use GPU" also moves preview decoding to the GPU when
+        # ffplay is new enough (7.1+) to take -hwaccel, and decodes on the CPU otherwise
+        use_hw = self.use_gpu.get() and ffplay_has_option("hwaccel")
+        hw_args = ["-hwaccel", "auto"] if use_hw else []
+        cmd = [get_binary("ffplay"), "-window_title", "Delogo Preview", *hw_args,
                "-vf", vf, "-t", "10", "-autoexit", input_path]
                
         self.run_command(cmd)
     
-    def build_command(self) -> list:
-        input_path = self.input_entry.get()
-        output_path = self.output_entry.get()
-        
-        if not input_path or not output_path:
-            return None
+    def _region_filter(self, input_path):
+        """The delogo (or drawbox) filter chain for the entered region, or None if a field is invalid.
         
+        With "Also center-crop" ticked the crop is chained after the delogo so
+        both edits share one decode and one encode.
+        """
         x = self.x_entry.get().strip()
         y = self.y_entry.get().strip()
         w = self.w_entry.get().strip()
         h = self.h_entry.get().strip()
-        
-        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
+        # Reject garbage here instead of letting ffmpeg fail on it after startup
+        for v in (x, y, w, h):
+            if not _EXPR_RE.match(v):
+                return None
+        
+        if self._frame_size and input_path == self._probed_path:
+            # Resolve to pixels and keep the box off the outermost pixels, which
+            # delogo needs for interpolation and rejects as outside the frame
+            fw, fh = self._frame_size
+            x, y, w, h = (self._resolve(v, full) for v, full in ((x, fw), (y, fh), (w, fw), (h, fh)))
+            x = max(1, min(x, fw - 2))
+            y = max(1, min(y, fh - 2))
+            w = max(1, min(w, fw - 1 - x))
+            h = max(1, min(h, fh - 1 - y))
         
         if self.show_region.get():
             # Draw rectangle instead of delogo (for testing)
-            vf = f"drawbox=x={x}:y={y}:w={w}:h={h}:c=red:t=2"
+            filters = [f"drawbox=x={x}:y={y}:w={w}:h={h}:c=red:t=2"]
         else:
-            vf = f"delogo=x={x}:y={y}:w={w}:h={h}"
+            filters = [f"delogo=x={x}:y={y}:w={w}:h={h}"]
+        
+        if self.crop_after.get():
+            cw = self.crop_w_entry.get().strip()
+            ch = self.crop_h_entry.get().strip()
+            if not (_INT_RE.match(cw) and _INT_RE.match(ch)):
+                return None
+            filters.append(f"crop={cw}:{ch}:(in_w-{cw})/2:(in_h-{ch})/2")
+        
+        return ",".join(filters)
+    
+    @staticmethod
+    def _resolve(value, full):
+        """Pixel value of a validated field: a number, or iw/ih with an optional offset."""
+        if value[:2] in ("iw", "ih"):
+            return full + int(value[2:] or 0)
+        return int(value)
+    
+    def build_command(self, input_path=None, output_path=None) -> list:
+        input_path = input_path or self.input_entry.get()
+        output_path = output_path or self.output_entry.get()
+        
+        if not input_path or not output_path:
+            return None
         
-        cmd.extend(["-vf", vf])
-        cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "copy"])
-        cmd.append(output_path)
+        vf = self._region_filter(input_path)
+        if not vf:
+            return None
         
-        return cmd
+        preset = self.preset_var.get()
+        # The outline preview stays on the CPU path; it is a quick check, not a final encode
+        if self.use_gpu.get() and not self.show_region.get() and has_cuda() and has_nvenc():
+            # Decode and encode on the GPU; delogo has no CUDA version, so decoded frames
+            # arrive in system memory in whatever format the source has (or from the
+            # software decoder when NVDEC can't handle it) and NVENC uploads them itself
+            return [get_binary("ffmpeg"), "-y", "-hwaccel", "cuda",
+                    "-i", input_path,
+                    "-vf", f"format=yuv420p,{vf}",
+                    "-c:v", "h264_nvenc", "-preset", NVENC_PRESETS.get(preset, "p4"),
+                    *nvenc_quality_args(23),
+                    *_OUTPUT_ARGS, output_path]
+        
+        return [get_binary("ffmpeg"), "-y", "-i", input_path, "-vf", vf,
+                "-c:v", "libx264", "-preset", preset, "-crf", "23", "-pix_fmt", "yuv420p",
+                *_OUTPUT_ARGS, output_path]
+    
+    def _warn_invalid(self):
+        """Explain why build_command returned None."""
+        if not self.input_entry.get() or not self.output_entry.get():
+            messagebox.showwarning("Missing Input", "Please select input and output files.")
+        else:
+            messagebox.showwarning("Invalid Region", "X, Y, W and H must be numbers (or iw-N / ih-N), "
+                                   "and the crop size whole numbers.")
     
     def preview_command(self):
         cmd = self.build_command()
         if cmd:
             self.set_preview(cmd)
         else:
-            messagebox.showwarning("Missing Input", "Please select input and output files.")
+            self._warn_invalid()
     
     def run_delogo(self):
         cmd = self.build_command()
         if not cmd:
-            messagebox.showwarning("Missing Input", "Please select input and output files.")
+            self._warn_invalid()
             return
         
         self.set_preview(cmd)
-        self.run_command(cmd, self.input_entry.get())
+        
+        if len(self._active_batch()) > 1:
+            jobs = []
+            for path in self.batch_files:
+                job = self.build_command(path, generate_output_path(path, "_delogo"))
+                # Several encodes share the CPU; cap each one's threads
+                job[-1:-1] = ["-threads", "2"]
+                jobs.append((os.path.basename(path), job))
+            self.run_parallel(jobs)
+            return
+        
+        input_path = self.input_entry.get()
+        segments = self.parallel_segments.get()
+        if segments > 1:
+            if input_path == self._probed_path and self._duration:
+                self._run_segments(cmd, input_path, self._duration, segments)
+            else:
+                # Typed path: probe off the Tk thread, then split
+                future = probe_async(input_path, get_media_duration)
+                future.add_done_callback(lambda f: self.root.after(
+                    0, self._run_segments, cmd, input_path, f.result(), segments))
+            return
+        
+        self.run_command(cmd, input_path)
+    
+    def _run_segments(self, cmd, input_path, duration, segments):
+        """Encode in parallel segments, or as one run when the duration is unknown."""
+        if duration:
+            jobs, final, temp_files = segment_jobs(cmd, duration, segments)
+            self.run_parallel(jobs, max_workers=segments, final=final,
+                              cleanup=temp_files, unit="segments")
+        else:
+            self.run_command(cmd, input_path)
 
 
 
@@ -251,6 +404,11 @@ except ImportError:
     HAS_PIL = False
 
 class FrameSelectorDialog(tk.Toplevel):
+    # (video path, mtime, time) -> mip levels, shared by every dialog; oldest evicted first
+    _frame_cache = OrderedDict()
+    _frame_cache_lock = threading.Lock()
+    FRAME_CACHE_SIZE = 4
+    
     def __init__(self, parent, video_path):
         super().__init__(parent)
         self.title("Select Area")
@@ -258,43 +416,83 @@ class FrameSelectorDialog(tk.Toplevel):
         self.result = None
         
         self.video_path = video_path
-        self.temp_image_path = TEMP_DIR / "delogo_preview.png"
         
         # State
         self.pil_image = None  # Original PIL image
+        self.mips = []         # pil_image halved repeatedly; mips[0] is the original
         self.tk_image = None   # Current displayed ImageTk
         self.scale = 1.0       # Current zoom level
         self.rect_coords = None # (x1, y1, x2, y2) in ORIGINAL image coordinates
+        self._zoom_pending = None  # after() id of the redraw a zoom burst is waiting on
+        self._final_sharpen_job = None  # after() id of the LANCZOS redraw once zooming stops
         
         if not HAS_PIL:
             messagebox.showerror("Error", "Pillow (PIL) library is required for this feature.")
             self.destroy()
             return
 
-        self.extract_frame()
+        # Show the window right away; the frame is decoded off the Tk thread
         self.build_ui()
-        
-        # After UI is built and window is shown, fit to screen
-        self.after(100, self.fit_to_window)
+        self.loading_id = self.canvas.create_text(20, 20, text="Loading frame…", fill="#aaa", anchor="nw")
+        threading.Thread(target=self._load_frame_bg, daemon=True).start()
         
     def extract_frame(self, time="5"):
-        # Extract frame
-        if self.temp_image_path.exists():
-            try: os.remove(self.temp_image_path)
-            except: pass
-            
-        cmd = [get_binary("ffmpeg"), "-y", "-ss", str(time), "-i", self.video_path, 
-               "-vframes", "1", str(self.temp_image_path)]
-        subprocess.run(cmd, capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0)
-        
-        if self.temp_image_path.exists():
-            try:
-                self.pil_image = Image.open(self.temp_image_path)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load image: {e}")
-                self.pil_image = None
-        else:
-             messagebox.showerror("Error", "Could not extract frame.")
+        """Decode one frame and its mip levels; returns (mips, error). Safe to call off the Tk thread."""
+        try:
+            key = (self.video_path, os.path.getmtime(self.video_path), str(time))
+        except OSError:
+            key = None
+        cache = self._frame_cache
+        with self._frame_cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key], None
+        
+        # Extract one frame as PNG straight into memory (input-side seek, no temp file)
+        cmd = [get_binary("ffmpeg"), "-ss", str(time), "-i", self.video_path,
+               "-frames:v", "1", "-f", "image2pipe", "-c:v", "png", "pipe:1"]
+        try:
+            data = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True,
+                                  **SPAWN_KWARGS).stdout
+        except:
+            data = b""
+        
+        if not data:
+            return None, "Could not extract frame."
+        try:
+            # Zooming out resizes from the nearest half-size level instead of the full frame
+            mips = [Image.open(io.BytesIO(data))]
+            while mips[-1].width >= 128:
+                mips.append(mips[-1].reduce(2))
+        except Exception as e:
+            return None, f"Failed to load image: {e}"
+        
+        if key is not None:
+            with self._frame_cache_lock:
+                cache[key] = mips
+                if len(cache) > self.FRAME_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return mips, None
+    
+    def _load_frame_bg(self):
+        mips, error = self.extract_frame()
+        try:
+            self.after(0, self._on_frame_ready, mips, error)
+        except:
+            pass  # Dialog closed while decoding
+    
+    def _on_frame_ready(self, mips, error):
+        if not self.winfo_exists():
+            return
+        self.canvas.delete(self.loading_id)
+        if error:
+            messagebox.showerror("Error", error, parent=self)
+            return
+        self.mips = mips
+        self.pil_image = mips[0]
+        # Fit once the canvas has its real size
+        self.update_idletasks()
+        self.fit_to_window()
 
     def build_ui(self):
         # Toolbar
@@ -308,8 +506,8 @@ class FrameSelectorDialog(tk.Toplevel):
         ctrl.pack(side="right")
         
         ttk.Button(ctrl, text="Fit Screen", command=self.fit_to_window).pack(side="left", padx=2)
-        ttk.Button(ctrl, text="-", width=3, command=lambda: self.zoom(0.8)).pack(side="left", padx=2)
-        ttk.Button(ctrl, text="+", width=3, command=lambda: self.zoom(1.2)).pack(side="left", padx=2)
+        ttk.Button(ctrl, text="-", width=3, command=partial(self.zoom, 0.8)).pack(side="left", padx=2)
+        ttk.Button(ctrl, text="+", width=3, command=partial(self.zoom, 1.2)).pack(side="left", padx=2)
         ttk.Button(ctrl, text="Reset Selection", command=self.reset_selection).pack(side="left", padx=5)
         ttk.Button(ctrl, text="Confirm", style="Accent.TButton", command=self.confirm).pack(side="left", padx=5)
         
@@ -345,6 +543,7 @@ class FrameSelectorDialog(tk.Toplevel):
         # Windows/Linux difference support for wheel? usually <MouseWheel> works on windows.
         
         self.draw_rect_id = None
+        self.img_id = None
     
     def fit_to_window(self):
         if not self.pil_image: return
@@ -357,14 +556,28 @@ class FrameSelectorDialog(tk.Toplevel):
             scale_w = cw / iw
             scale_h = ch / ih
             self.scale = min(scale_w, scale_h) * 0.95 # Slight padding
-            self.redraw()
+            self.redraw(hq=True)
             # Center it
             self.canvas.xview_moveto(0)
             self.canvas.yview_moveto(0)
 
     def zoom(self, factor):
         self.scale *= factor
+        # A wheel flick fires a burst of events; redraw once per frame, not once per tick
+        if self._zoom_pending is None:
+            self._zoom_pending = self.after(16, self._apply_zoom)
+    
+    def _apply_zoom(self):
+        self._zoom_pending = None
         self.redraw()
+        # Re-render sharply once the user stops zooming
+        if self._final_sharpen_job is not None:
+            self.after_cancel(self._final_sharpen_job)
+        self._final_sharpen_job = self.after(200, self._sharpen)
+    
+    def _sharpen(self):
+        self._final_sharpen_job = None
+        self.redraw(hq=True)
         
     def on_wheel(self, event):
         if event.delta > 0:
@@ -372,7 +585,8 @@ class FrameSelectorDialog(tk.Toplevel):
         else:
             self.zoom(0.9)
 
-    def redraw(self):
+    def redraw(self, hq=False):
+        """Render the frame at the current scale; BILINEAR while interacting, LANCZOS when hq."""
         if not self.pil_image: return
         
         # Calculate new size
@@ -381,45 +595,53 @@ class FrameSelectorDialog(tk.Toplevel):
         
         if nw < 1 or nh < 1: return
         
-        # Resample
-        resized = self.pil_image.resize((nw, nh), Image.Resampling.LANCZOS)
+        # Start from the smallest mip level still at least as large as the target
+        level = min(int(math.log2(1 / self.scale)), len(self.mips) - 1) if self.scale < 1 else 0
+        resample = Image.Resampling.LANCZOS if hq else Image.Resampling.BILINEAR
+        resized = self.mips[level].resize((nw, nh), resample)
         self.tk_image = ImageTk.PhotoImage(resized)
         
+        # Swap the picture on the existing canvas item rather than recreating it
+        if self.img_id is None:
+            self.img_id = self.canvas.create_image(0, 0, image=self.tk_image, anchor="nw", tags="img")
+            self.canvas.tag_lower(self.img_id)
+        else:
+            self.canvas.itemconfigure(self.img_id, image=self.tk_image)
         # Provide plenty of scrollregion
-        self.canvas.delete("img") # remove old
-        self.canvas.create_image(0, 0, image=self.tk_image, anchor="nw", tags="img")
         self.canvas.config(scrollregion=(0, 0, nw, nh))
         
         # Re-draw rectangle if exists
         self.draw_existing_rect()
 
     def draw_existing_rect(self):
-        if self.draw_rect_id:
-            self.canvas.delete(self.draw_rect_id)
+        """Move the selection rectangle to the current scale; the frame itself is untouched."""
+        if not self.rect_coords:
+            if self.draw_rect_id:
+                self.canvas.delete(self.draw_rect_id)
+                self.draw_rect_id = None
+            return
         
-        if self.rect_coords:
-            x1, y1, x2, y2 = self.rect_coords
-            # Convert to current scale
-            sx1 = x1 * self.scale
-            sy1 = y1 * self.scale
-            sx2 = x2 * self.scale
-            sy2 = y2 * self.scale
-            
-            self.draw_rect_id = self.canvas.create_rectangle(sx1, sy1, sx2, sy2, outline="red", width=2, tags="rect")
+        # Convert to current scale
+        scaled = [c * self.scale for c in self.rect_coords]
+        if self.draw_rect_id:
+            self.canvas.coords(self.draw_rect_id, *scaled)
+        else:
+            self.draw_rect_id = self.canvas.create_rectangle(*scaled, outline="red", width=2, tags="rect")
 
     # --- Drawing Logic ---
     def on_draw_start(self, event):
         self.start_draw_x = self.canvas.canvasx(event.x)
         self.start_draw_y = self.canvas.canvasy(event.y)
         
+        # Reuse the existing rectangle item; only the first selection creates one
         if self.draw_rect_id:
-            self.canvas.delete(self.draw_rect_id)
-            self.draw_rect_id = None
-            
-        self.draw_rect_id = self.canvas.create_rectangle(
-            self.start_draw_x, self.start_draw_y, self.start_draw_x, self.start_draw_y, 
-            outline="red", width=2, tags="rect"
-        )
+            self.canvas.coords(self.draw_rect_id, self.start_draw_x, self.start_draw_y,
+                               self.start_draw_x, self.start_draw_y)
+        else:
+            self.draw_rect_id = self.canvas.create_rectangle(
+                self.start_draw_x, self.start_draw_y, self.start_draw_x, self.start_draw_y, 
+                outline="red", width=2, tags="rect"
+            )
 
     def on_draw_drag(self, event):
         cur_x = self.canvas.canvasx(event.x)
@@ -6,22 +6,25 @@ Apply video noise reduction
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
+from functools import partial
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
-    generate_output_path, browse_file, browse_save_file, create_card, get_theme
+    FFmpegToolApp, get_binary, get_media_duration, probe_async, format_duration,
+    generate_output_path, browse_file, browse_save_file, create_card,
+    has_filter, has_nvenc, segment_jobs, NVENC_PRESETS, nvenc_quality_args
 )
 
 class DenoiseApp(FFmpegToolApp):
     """Video denoising tool."""
     
+    # (button text, hqdn3d luma strength); chroma and NLMeans strength derive from it
+    PRESETS = (("Light", 2.0), ("Medium", 4.0), ("Heavy", 7.0))
+    
     def __init__(self):
-        super().__init__("FFmpeg Denoise", width=600, height=550)
+        super().__init__("FFmpeg Denoise", width=600, height=610)
         self.build_ui()
     
     def build_ui(self):
-        theme = get_theme()
-        
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill="both", expand=True)
         
@@ -94,12 +97,29 @@ class DenoiseApp(FFmpegToolApp):
         preset_row.pack(fill="x", pady=5)
         
         ttk.Label(preset_row, text="Presets:").pack(side="left")
-        presets = [("Light", 2.0), ("Medium", 4.0), ("Heavy", 7.0)]
-        for name, value in presets:
+        for name, value in self.PRESETS:
             btn = ttk.Button(preset_row, text=name, width=8,
-                           command=lambda v=value: self._apply_preset(v))
+                           command=partial(self._apply_preset, value))
             btn.pack(side="left", padx=2)
         
+        # NLMeans runs as nlmeans_opencl and the encode uses NVENC, each only if the build has it
+        self.use_gpu = tk.BooleanVar(value=False)
+        ttk.Checkbutton(denoise_card, text="Use GPU (OpenCL NLMeans / NVENC encode)",
+                        variable=self.use_gpu).pack(anchor="w", pady=5)
+        
+        # Long videos can be encoded as N time ranges at once and joined losslessly
+        segment_row = ttk.Frame(denoise_card)
+        segment_row.pack(fill="x", pady=5)
+        ttk.Label(segment_row, text="Parallel segments:").pack(side="left")
+        self.parallel_segments = tk.IntVar(value=1)
+        ttk.Combobox(segment_row, textvariable=self.parallel_segments, width=3, state="readonly",
+                     values=[1, 2, 4, 8]).pack(side="left", padx=5)
+        
+        ttk.Label(segment_row, text="Speed:").pack(side="left", padx=(15, 0))
+        self.preset_var = tk.StringVar(value="veryfast")
+        ttk.Combobox(segment_row, textvariable=self.preset_var, width=10, state="readonly",
+                     values=["veryfast", "medium", "slow"]).pack(side="left", padx=5)
+        
         # === Output Section ===
         output_card = create_card(main_frame, "📤 Output")
         output_card.pack(fill="x", pady=(0, 10))
@@ -166,20 +186,35 @@ class DenoiseApp(FFmpegToolApp):
             return None
         
         filter_type = self.filter_var.get()
+        use_gpu = self.use_gpu.get()
+        hw_args = []
         
+        # Convert to the 8-bit 4:2:0 output format up front, so the denoiser works on
+        # that layout instead of the source's (10-bit/RGB) and no late conversion is needed
         if filter_type == "hqdn3d":
             ls = self.luma_spatial.get()
             c = self.chroma.get()
-            vf = f"hqdn3d={ls}:{c}:{ls}:{c}"
+            vf = f"format=yuv420p,hqdn3d={ls}:{c}:{ls}:{c}"
         elif filter_type == "nlmeans":
             s = self.nlm_strength.get()
-            vf = f"nlmeans=s={s}"
+            if use_gpu and has_filter("nlmeans_opencl"):
+                # The patch search is the slow part; run it on the GPU and bring frames back for encoding
+                hw_args = ["-init_hw_device", "opencl=ocl", "-filter_hw_device", "ocl"]
+                vf = f"format=yuv420p,hwupload,nlmeans_opencl=s={s}:p=7:r=15,hwdownload,format=yuv420p"
+            else:
+                vf = f"format=yuv420p,nlmeans=s={s}"
         else:  # atadenoise
-            vf = "atadenoise"
+            vf = "format=yuv420p,atadenoise"
         
-        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
+        cmd = [get_binary("ffmpeg"), "-y", *hw_args, "-i", input_path]
         cmd.extend(["-vf", vf])
-        cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "copy"])
+        preset = self.preset_var.get()
+        if use_gpu and has_nvenc():
+            cmd.extend(["-c:v", "h264_nvenc", "-preset", NVENC_PRESETS.get(preset, "p4"),
+                        *nvenc_quality_args(23), "-c:a", "copy"])
+        else:
+            cmd.extend(["-c:v", "libx264", "-preset", preset, "-crf", "23", "-pix_fmt", "yuv420p",
+                        "-c:a", "copy"])
         cmd.append(output_path)
         
         return cmd
@@ -198,7 +233,26 @@ class DenoiseApp(FFmpegToolApp):
             return
         
         self.set_preview(cmd)
-        self.run_command(cmd, self.input_entry.get())
+        
+        input_path = self.input_entry.get()
+        segments = self.parallel_segments.get()
+        if segments > 1:
+            # Probe off the Tk thread (usually a cache hit from browsing), then split
+            future = probe_async(input_path, get_media_duration)
+            future.add_done_callback(lambda f: self.root.after(
+                0, self._run_segments, cmd, input_path, f.result(), segments))
+            return
+        
+        self.run_command(cmd, input_path)
+    
+    def _run_segments(self, cmd, input_path, duration, segments):
+        """Encode in parallel segments, or as one run when the duration is unknown."""
+        if duration:
+            jobs, final, temp_files = segment_jobs(cmd, duration, segments)
+            self.run_parallel(jobs, max_workers=segments, final=final,
+                              cleanup=temp_files, unit="segments")
+        else:
+            self.run_command(cmd, input_path)
 
 
 if __name__ == "__main__":
@@ -10,12 +10,15 @@ import os
 import shutil
 import urllib.request
 import urllib.error
+import http.client
 import zipfile
 import tarfile
+import tempfile
 from pathlib import Path
 import threading
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add current directory to path
 sys.path.append(str(Path(__file__).parent))
@@ -24,7 +27,9 @@ from ffmpeg_common import (
     get_theme, 
     create_card, 
     BINS_DIR, 
-    ensure_dir
+    ensure_dir,
+    get_binary,
+    get_ffmpeg_caps
 )
 
 # Constants
@@ -32,6 +37,31 @@ FFMPEG_URL_WIN = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.z
 YTDLP_URL = "https://github.com/yt-dlp/yt-dlp/releases/download/2026.01.31/yt-dlp.exe" # User specified tag
 CAESIUM_RELEASES_API = "https://api.github.com/repos/Lymphatus/caesium-clt/releases/latest"
 
+# Chunk size for downloads and archive extraction (~100 MB binaries)
+COPY_BLOCK_SIZE = 1 << 20
+# Downloaded archives stay in memory up to this size before spilling to a temp file
+SPOOL_MAX_SIZE = 256 << 20
+# Dropped connections are resumed with a Range request this many times
+DOWNLOAD_RETRIES = 3
+
+# Tools managed here, in display order
+TOOL_KEYS = ("ffmpeg", "yt-dlp", "caesium-clt")
+# Executables taken from the bin/ folder of the FFmpeg release archive
+FFMPEG_EXES = frozenset(("ffmpeg.exe", "ffprobe.exe", "ffplay.exe"))
+
+# Dependency checks stat bins/ and scan PATH; run them off the Tk thread
+_CHECK_POOL = ThreadPoolExecutor(max_workers=len(TOOL_KEYS))
+
+# (name, PATH) -> shutil.which result; cleared after an install changes what's on disk
+_WHICH_CACHE = {}
+
+def _which(name):
+    """shutil.which, remembered so toggling portable mode doesn't rescan PATH."""
+    key = (name, os.environ.get("PATH", ""))
+    if key not in _WHICH_CACHE:
+        _WHICH_CACHE[key] = shutil.which(name)
+    return _WHICH_CACHE[key]
+
 class DependencyManager(FFmpegToolApp):
     def __init__(self):
         super().__init__("Dependency Manager", width=800, height=600)
@@ -47,6 +77,9 @@ class DependencyManager(FFmpegToolApp):
             "yt-dlp": tk.StringVar(),
             "caesium-clt": tk.StringVar()
         }
+        # One install at a time per tool; different tools may update concurrently
+        self._update_locks = {key: threading.Lock() for key in TOOL_KEYS}
+        self._check_generation = 0  # Bumped per check round so stale results are dropped
         
         self.build_ui()
         self.check_all_dependencies()
@@ -109,14 +142,24 @@ class DependencyManager(FFmpegToolApp):
         ttk.Button(actions, text="Update/Install", command=lambda k=key: self.start_update(k)).pack(side="right")
 
     def check_all_dependencies(self):
-        """Check status of all tools."""
-        for key in ["ffmpeg", "yt-dlp", "caesium-clt"]:
-            self.check_dependency(key)
+        """Check status of all tools concurrently; rows update as each check finishes."""
+        self._check_generation += 1
+        generation = self._check_generation
+        portable = self.portable_var.get()
+        for key in TOOL_KEYS:
+            self.status_vars[key].set("Checking...")
+            future = _CHECK_POOL.submit(self._locate, key, portable)
+            future.add_done_callback(
+                lambda f, key=key: self.root.after(0, self._apply_check, generation, key, f.result()))
 
     def check_dependency(self, key):
         """Check a single dependency."""
         self.status_vars[key].set("Checking...")
-        
+        self._apply_check(self._check_generation, key, self._locate(key, self.portable_var.get()))
+    
+    @staticmethod
+    def _locate(key, portable):
+        """Path of the tool to use, or None; touches no Tk state so it can run on a worker."""
         # Determine target name (windows)
         exe_name = key
         if key == "caesium-clt":
@@ -129,7 +172,7 @@ class DependencyManager(FFmpegToolApp):
         # 1. Check Portable (bins)
         local_path = BINS_DIR / exe_name
         if local_path.exists():
-            if self.portable_var.get():
+            if portable:
                 found_path = str(local_path)
             else:
                 # Even if not portable, if it's in bins, we might acknowledge it,
@@ -138,15 +181,19 @@ class DependencyManager(FFmpegToolApp):
         
         # 2. Check System PATH (if not portable or not found locally yet)
         if not found_path:
-            system_path = shutil.which(key) or shutil.which(exe_name.replace(".exe", ""))
+            system_path = _which(key) or _which(exe_name.replace(".exe", ""))
             if system_path:
-                if not self.portable_var.get():
+                if not portable:
                     found_path = system_path
                 else:
                     # If portable is ON, but we found it in system, we still prefer local.
                     # If not found locally, we show "Not installed (Portable)"
                     pass
-
+        return found_path
+    
+    def _apply_check(self, generation, key, found_path):
+        if generation != self._check_generation:
+            return  # A newer check (e.g. portable mode toggled again) is in flight
         if found_path:
             self.path_vars[key].set(found_path)
             
@@ -162,15 +209,24 @@ class DependencyManager(FFmpegToolApp):
             self.status_vars[key].set("Not Installed")
 
     def start_update(self, key):
-        """Start update thread."""
-        if self.runner.is_running():
-            messagebox.showwarning("Busy", "Wait for current task to finish.")
+        """Start update thread; other tools can update at the same time."""
+        if self._update_locks[key].locked():
+            messagebox.showwarning("Busy", "This tool is already being updated.")
             return
             
         threading.Thread(target=self.perform_update, args=(key,), daemon=True).start()
 
     def perform_update(self, key):
         """Download and install the tool."""
+        # Guards this tool's files in BINS_DIR against a second concurrent install
+        if not self._update_locks[key].acquire(blocking=False):
+            return
+        try:
+            self._perform_update(key)
+        finally:
+            self._update_locks[key].release()
+    
+    def _perform_update(self, key):
         self.run_btn = None # Hack to disable button logic in base class if used
         
         def update_status_cb(percent, text=None):
@@ -195,6 +251,10 @@ class DependencyManager(FFmpegToolApp):
             elif key == "caesium-clt":
                 self._install_caesium(update_status_cb)
                 
+            # Newly installed binaries in BINS_DIR take precedence over cached lookups
+            get_binary.cache_clear()
+            get_ffmpeg_caps.cache_clear()
+            _WHICH_CACHE.clear()
             update_status_cb(100, "Installed / Updated")
             self._on_log(f"\nSuccessfully updated {key}!\n")
             
@@ -206,55 +266,99 @@ class DependencyManager(FFmpegToolApp):
             self.status_vars[key].set("Error")
             self._on_finished(False, str(e))
 
-    def _download_file(self, url, target_path, progress_cb=None):
-        """Download file with progress."""
+    def _download_file(self, url, target, progress_cb=None):
+        """Download file with progress; target is a path or an open binary file.
+        
+        A dropped connection resumes from the bytes already written instead of
+        starting over, falling back to a full download if the server ignores Range.
+        """
+        if not hasattr(target, "write"):
+            with open(target, 'wb') as f:
+                return self._download_file(url, f, progress_cb)
+        
         self._on_log(f"Downloading {url}...\n")
+        start = target.tell()
+        total_size = 0
+        
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            done = target.tell() - start
+            headers = {'User-Agent': 'Mozilla/5.0'}
+            if done:
+                headers['Range'] = f"bytes={done}-"
+            req = urllib.request.Request(url, headers=headers)
+            try:
+                with urllib.request.urlopen(req) as response:
+                    if done and response.status != 206:
+                        # Full body despite the Range header: start over
+                        target.seek(start)
+                        target.truncate()
+                        done = 0
+                    if not total_size:
+                        total_size = done + int((response.getheader('Content-Length') or "0").strip())
+                    self._copy_response(response, target, progress_cb, done, total_size)
+                return
+            except urllib.error.HTTPError:
+                raise
+            except (urllib.error.URLError, http.client.HTTPException, ConnectionError, TimeoutError) as e:
+                if attempt == DOWNLOAD_RETRIES:
+                    raise
+                self._on_log(f"Connection lost ({e}), resuming...\n")
+                time.sleep(1)
+    
+    @staticmethod
+    def _copy_response(response, f, progress_cb, downloaded=0, total_size=None):
+        if total_size is None:
+            total_size = int((response.getheader('Content-Length') or "0").strip())
+        last_percent = -1
+        # 1 MiB blocks: ~100 loop iterations and writes for an FFmpeg build instead of ~12k
+        block_size = COPY_BLOCK_SIZE
         
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req) as response:
-            total_size = int(response.getheader('Content-Length', 0).strip())
-            downloaded = 0
-            block_size = 8192
+        while True:
+            buffer = response.read(block_size)
+            if not buffer:
+                break
+            downloaded += len(buffer)
+            f.write(buffer)
             
-            with open(target_path, 'wb') as f:
-                while True:
-                    buffer = response.read(block_size)
-                    if not buffer:
-                        break
-                    downloaded += len(buffer)
-                    f.write(buffer)
-                    
-                    # Update progress (0-100% relative to download)
-                    if total_size > 0:
-                        percent = int((downloaded / total_size) * 100)
-                        if progress_cb:
-                            progress_cb(percent)
+            # Update progress (0-100% relative to download), only when it moves
+            if total_size > 0 and progress_cb:
+                percent = downloaded * 100 // total_size
+                if percent != last_percent:
+                    last_percent = percent
+                    progress_cb(percent)
 
     def _install_ffmpeg(self, progress_cb):
         url = FFMPEG_URL_WIN
-        zip_path = BINS_DIR / "ffmpeg.zip"
         
         # Wrapper to scale download progress (0-80%)
         def dl_progress(p):
             progress_cb(int(p * 0.8), f"Downloading FFmpeg... {p}%")
             
-        self._download_file(url, zip_path, dl_progress)
-        
-        progress_cb(85, "Extracting...")
-        self._on_log("Extracting FFmpeg...\n")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # Find the bin folder inside zip
-            bin_files = [f for f in zip_ref.namelist() if f.endswith('.exe') and 'bin/' in f]
+        # Keep the archive in memory (spilling to a temp file only past the limit)
+        # instead of writing ffmpeg.zip to disk and reading it back
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as archive:
+            self._download_file(url, archive, dl_progress)
+            archive.seek(0)
             
-            for file in bin_files:
-                filename = os.path.basename(file)
-                source = zip_ref.open(file)
-                target = open(BINS_DIR / filename, "wb")
-                with source, target:
-                    shutil.copyfileobj(source, target)
-                self._on_log(f"Extracted {filename}\n")
-        
-        os.remove(zip_path)
+            progress_cb(85, "Extracting...")
+            self._on_log("Extracting FFmpeg...\n")
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
+                # One pass over the central directory, stopping once every exe is found
+                bin_files = []
+                for info in zip_ref.infolist():
+                    if info.filename.rpartition("/")[2] in FFMPEG_EXES:
+                        bin_files.append(info)
+                        if len(bin_files) == len(FFMPEG_EXES):
+                            break
+                self._extract_files(zip_ref, bin_files)
+    
+    def _extract_files(self, zip_ref, members):
+        """Extract archive members flat into BINS_DIR, copying in large blocks."""
+        for file in members:
+            filename = os.path.basename(getattr(file, "filename", file))
+            with zip_ref.open(file) as source, open(BINS_DIR / filename, "wb") as target:
+                shutil.copyfileobj(source, target, length=COPY_BLOCK_SIZE)
+            self._on_log(f"Extracted {filename}\n")
 
     def _install_ytdlp(self, progress_cb):
         url = YTDLP_URL
@@ -284,28 +388,19 @@ class DependencyManager(FFmpegToolApp):
         if not asset_url:
             raise Exception("Could not find Windows asset for Caesium CLT")
             
-        zip_path = BINS_DIR / "caesium.zip"
-        
         def dl_progress(p):
             # Scale 10-90%
             scaled = 10 + int(p * 0.8)
             progress_cb(scaled, f"Downloading Caesium... {p}%")
             
-        self._download_file(asset_url, zip_path, dl_progress)
-        
-        progress_cb(95, "Extracting...")
-        self._on_log("Extracting Caesium...\n")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for file in zip_ref.namelist():
-                if file.endswith(".exe"):
-                    filename = os.path.basename(file)
-                    source = zip_ref.open(file)
-                    target = open(BINS_DIR / filename, "wb")
-                    with source, target:
-                        shutil.copyfileobj(source, target)
-                    self._on_log(f"Extracted {filename}\n")
-                    
-        os.remove(zip_path)
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as archive:
+            self._download_file(asset_url, archive, dl_progress)
+            archive.seek(0)
+            
+            progress_cb(95, "Extracting...")
+            self._on_log("Extracting Caesium...\n")
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
+                self._extract_files(zip_ref, [f for f in zip_ref.namelist() if f.endswith(".exe")])
 
 if __name__ == "__main__":
     app = DependencyManager()
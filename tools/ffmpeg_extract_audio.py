@@ -8,10 +8,22 @@ from tkinter import ttk, messagebox
 from pathlib import Path
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
+    FFmpegToolApp, get_binary, get_media_duration, probe_async, format_duration,
     generate_output_path, browse_file, browse_save_file, create_card, get_theme
 )
 
+# Output format -> audio encoder
+_CODECS = {
+    "mp3": "libmp3lame",
+    "aac": "aac",
+    "m4a": "aac",
+    "ogg": "libvorbis",
+    "flac": "flac",
+    "wav": "pcm_s16le"
+}
+# Formats that take no bitrate
+_LOSSLESS = frozenset(("wav", "flac"))
+
 class ExtractAudioApp(FFmpegToolApp):
     """Audio extraction tool."""
     
@@ -116,15 +128,23 @@ class ExtractAudioApp(FFmpegToolApp):
         
         input_path = self.input_entry.get()
         if input_path:
-            duration = get_media_duration(input_path)
-            if duration:
-                self.duration_label.configure(text=f"Duration: {format_duration(duration)}")
+            # Probe off the Tk thread; the label fills in when ffprobe returns
+            self.duration_label.configure(text="Duration: probing…")
+            future = probe_async(input_path, get_media_duration)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._apply_duration, input_path, f.result()))
             
             ext = "." + self.format_var.get()
             output_path = generate_output_path(input_path, "", ext)
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, output_path)
     
+    def _apply_duration(self, input_path, duration):
+        if input_path != self.input_entry.get():
+            return  # Superseded by a later browse
+        dur_str = format_duration(duration) if duration else "--:--:--"
+        self.duration_label.configure(text=f"Duration: {dur_str}")
+    
     def _browse_output(self):
         ext = self.format_var.get()
         filetypes = [(f"{ext.upper()} files", f"*.{ext}"), ("All files", "*.*")]
@@ -146,36 +166,25 @@ class ExtractAudioApp(FFmpegToolApp):
             return None
         
         fmt = self.format_var.get()
-        bitrate = self.bitrate_var.get()
-        
-        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
-        cmd.extend(["-vn"])  # No video
-        
-        # Codec based on format
-        codecs = {
-            "mp3": "libmp3lame",
-            "aac": "aac",
-            "m4a": "aac",
-            "ogg": "libvorbis",
-            "flac": "flac",
-            "wav": "pcm_s16le"
-        }
-        codec = codecs.get(fmt, "copy")
-        cmd.extend(["-c:a", codec])
+        sample_rate = self.sample_var.get()
+        channels = self.channel_var.get()
+        
+        # No video; codec based on format
+        cmd = [get_binary("ffmpeg"), "-y", "-i", input_path, "-vn", "-c:a", _CODECS.get(fmt, "copy")]
         
         # Bitrate (not for lossless)
-        if fmt not in ["wav", "flac"]:
-            cmd.extend(["-b:a", bitrate])
+        if fmt not in _LOSSLESS:
+            cmd += ["-b:a", self.bitrate_var.get()]
         
         # Sample rate
-        if self.sample_var.get() != "original":
-            cmd.extend(["-ar", self.sample_var.get()])
+        if sample_rate != "original":
+            cmd += ["-ar", sample_rate]
         
         # Channels
-        if self.channel_var.get() == "mono":
-            cmd.extend(["-ac", "1"])
-        elif self.channel_var.get() == "stereo":
-            cmd.extend(["-ac", "2"])
+        if channels == "mono":
+            cmd += ["-ac", "1"]
+        elif channels == "stereo":
+            cmd += ["-ac", "2"]
         
         cmd.append(output_path)
         return cmd
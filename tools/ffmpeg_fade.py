@@ -8,10 +8,13 @@ from tkinter import ttk, messagebox
 from pathlib import Path
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, format_duration,
+    FFmpegToolApp, get_binary, get_media_duration, probe_async, format_duration,
     generate_output_path, browse_file, browse_save_file, create_card, get_theme
 )
 
+# Video encoder settings shared by both audio paths
+_VIDEO_ARGS = ("-c:v", "libx264", "-crf", "23")
+
 class FadeApp(FFmpegToolApp):
     """Video fade effects tool."""
     
@@ -122,14 +125,24 @@ class FadeApp(FFmpegToolApp):
         
         input_path = self.input_entry.get()
         if input_path:
-            self.total_duration = get_media_duration(input_path) or 0
-            if self.total_duration:
-                self.duration_label.configure(text=f"Duration: {format_duration(self.total_duration)}")
+            # Probe off the Tk thread; fade-out is skipped until the duration is known
+            self.total_duration = 0
+            self.duration_label.configure(text="Duration: probing…")
+            future = probe_async(input_path, get_media_duration)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._apply_duration, input_path, f.result()))
             
             output_path = generate_output_path(input_path, "_faded")
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, output_path)
     
+    def _apply_duration(self, input_path, duration):
+        if input_path != self.input_entry.get():
+            return  # Superseded by a later browse
+        self.total_duration = duration or 0
+        dur_str = format_duration(duration) if duration else "--:--:--"
+        self.duration_label.configure(text=f"Duration: {dur_str}")
+    
     def _browse_output(self):
         filetypes = [("MP4 files", "*.mp4"), ("All files", "*.*")]
         browse_save_file(self.output_entry, filetypes, ".mp4")
@@ -141,40 +154,48 @@ class FadeApp(FFmpegToolApp):
         if not input_path or not output_path:
             return None
         
-        if not self.fadein_enable.get() and not self.fadeout_enable.get():
+        fade_in = self.fadein_enable.get()
+        fade_out = self.fadeout_enable.get()
+        if not fade_in and not fade_out:
             messagebox.showinfo("Info", "Please enable at least one fade effect.")
             return None
+        if fade_out and self.total_duration <= 0:
+            # Fade-out is placed relative to the end, so it needs the probed duration
+            messagebox.showwarning("Duration Unknown", "The video duration is still being probed or "
+                                   "could not be read, so the fade-out can't be placed yet.")
+            return None
         
         video_filters = []
         audio_filters = []
         
         color = self.fade_color.get()
+        audio_fade = self.audio_fade.get()
         
         # Fade in
-        if self.fadein_enable.get():
+        if fade_in:
             dur = self.fadein_dur.get()
             video_filters.append(f"fade=in:st=0:d={dur}:c={color}")
-            if self.audio_fade.get():
+            if audio_fade:
                 audio_filters.append(f"afade=in:st=0:d={dur}")
         
         # Fade out
-        if self.fadeout_enable.get() and self.total_duration > 0:
+        if fade_out:
             dur = self.fadeout_dur.get()
             start_time = self.total_duration - dur
             video_filters.append(f"fade=out:st={start_time}:d={dur}:c={color}")
-            if self.audio_fade.get():
+            if audio_fade:
                 audio_filters.append(f"afade=out:st={start_time}:d={dur}")
         
         cmd = [get_binary("ffmpeg"), "-y", "-i", input_path]
         
         if video_filters:
-            cmd.extend(["-vf", ",".join(video_filters)])
+            cmd += ["-vf", ",".join(video_filters)]
         
+        # Audio is re-encoded only when it gets a fade
         if audio_filters:
-            cmd.extend(["-af", ",".join(audio_filters)])
-            cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "aac"])
+            cmd += ["-af", ",".join(audio_filters), *_VIDEO_ARGS, "-c:a", "aac"]
         else:
-            cmd.extend(["-c:v", "libx264", "-crf", "23", "-c:a", "copy"])
+            cmd += [*_VIDEO_ARGS, "-c:a", "copy"]
         
         cmd.append(output_path)
         return cmd
@@ -183,7 +204,8 @@ class FadeApp(FFmpegToolApp):
         cmd = self.build_command()
         if cmd:
             self.set_preview(cmd)
-        else:
+        elif not self.input_entry.get() or not self.output_entry.get():
+            # Other failures have already explained themselves
             messagebox.showwarning("Missing Input", "Please select input and output files.")
     
     def run_fade(self):
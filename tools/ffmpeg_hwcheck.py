@@ -5,7 +5,6 @@ Detect and configure hardware acceleration (NVIDIA, Intel, AMD)
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import subprocess
 import json
 import sys
 from pathlib import Path
@@ -13,8 +12,8 @@ from pathlib import Path
 # Add current directory to path
 sys.path.append(str(Path(__file__).parent))
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, create_card, get_theme, 
-    save_config, load_config
+    FFmpegToolApp, create_card, get_theme, 
+    save_config, load_config, get_ffmpeg_caps, refresh_ffmpeg_caps
 )
 
 class HWCheckApp(FFmpegToolApp):
@@ -79,9 +78,10 @@ class HWCheckApp(FFmpegToolApp):
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(side="bottom", fill="x")
         
-        ttk.Button(btn_frame, text="🔄 Re-scan Hardware", command=self.auto_detect).pack(side="right")
+        ttk.Button(btn_frame, text="🔄 Re-scan Hardware", command=lambda: self.auto_detect(refresh=True)).pack(side="right")
     
-    def auto_detect(self):
+    def auto_detect(self, refresh=False):
+        """Show what the ffmpeg build supports; refresh=True re-probes instead of using the saved caps."""
         self.encoders = {}
         self.detected_methods = []
         
@@ -90,6 +90,9 @@ class HWCheckApp(FFmpegToolApp):
             self.status_labels[key].configure(text="Scanning...", foreground="gray")
         self.root.update()
         
+        if refresh:
+            refresh_ffmpeg_caps()
+        
         # 1. Check Hardware Acceleration Methods
         hw_accels = self.get_hw_accels()
         
@@ -145,21 +148,11 @@ class HWCheckApp(FFmpegToolApp):
         else:
             self.encoder_combo.current(0)
             
-    def get_hw_accels(self) -> list:
-        try:
-            cmd = [get_binary("ffmpeg"), "-hwaccels"]
-            result = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW if sys.platform=='win32' else 0)
-            return result.stdout.lower()
-        except:
-            return ""
+    def get_hw_accels(self) -> set:
+        return get_ffmpeg_caps()["hwaccels"]
 
-    def get_encoders(self) -> str:
-        try:
-            cmd = [get_binary("ffmpeg"), "-encoders"]
-            result = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW if sys.platform=='win32' else 0)
-            return result.stdout
-        except:
-            return ""
+    def get_encoders(self) -> set:
+        return get_ffmpeg_caps()["encoders"]
             
     def save_settings(self):
         selection = self.encoder_var.get()
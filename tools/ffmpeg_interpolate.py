@@ -116,17 +116,15 @@ class InterpolateApp(FFmpegToolApp):
             dur_str = format_duration(duration) if duration else "--:--:--"
             fps_str = "--"
             
-            if info and "streams" in info:
-                for stream in info["streams"]:
-                    if stream.get("codec_type") == "video":
-                        r_fps = stream.get("r_frame_rate", "0/1")
-                        try:
-                            num, den = map(int, r_fps.split("/"))
-                            if den > 0:
-                                fps_str = f"{num/den:.2f}"
-                        except:
-                            pass
-                        break
+            vstream = next((s for s in (info or {}).get("streams", ()) if s.get("codec_type") == "video"), None)
+            if vstream:
+                r_fps = vstream.get("r_frame_rate", "0/1")
+                try:
+                    num, den = map(int, r_fps.split("/"))
+                    if den > 0:
+                        fps_str = f"{num/den:.2f}"
+                except:
+                    pass
             
             self.info_label.configure(text=f"FPS: {fps_str} | Duration: {dur_str}")
             
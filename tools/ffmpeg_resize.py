@@ -8,7 +8,7 @@ from tkinter import ttk, messagebox
 from pathlib import Path
 
 from ffmpeg_common import (
-    FFmpegToolApp, get_binary, get_media_duration, get_media_info, format_duration,
+    FFmpegToolApp, get_binary, probe_fields, format_duration,
     generate_output_path, browse_file, browse_save_file, create_card, get_theme
 )
 
@@ -155,19 +155,14 @@ class ResizeApp(FFmpegToolApp):
         
         input_path = self.input_entry.get()
         if input_path:
-            duration = get_media_duration(input_path)
-            info = get_media_info(input_path)
+            fields = probe_fields(input_path)
+            duration = fields.duration if fields else None
             
             dur_str = format_duration(duration) if duration else "--:--:--"
             res_str = "--"
             
-            if info and "streams" in info:
-                for stream in info["streams"]:
-                    if stream.get("codec_type") == "video":
-                        w = stream.get("width", "?")
-                        h = stream.get("height", "?")
-                        res_str = f"{w}x{h}"
-                        break
+            if fields and fields.width:
+                res_str = f"{fields.width}x{fields.height}"
             
             self.info_label.configure(text=f"Duration: {dur_str} | Resolution: {res_str}")
             